@@ -1,14 +1,27 @@
 import asyncio
+import random
 import time
+from types import MappingProxyType
 
 import aiohttp
 from aiohttp import BasicAuth
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+
+# Request constants shared by every token fetch. The body is pre-encoded
+# because aiohttp only form-encodes plain dicts.
+_FORM_HEADERS = MappingProxyType({"Content-Type": "application/x-www-form-urlencoded"})
+_GRANT_PAYLOAD = b"grant_type=client_credentials"
+
+# Token fetches are retried on connection errors with jittered exponential backoff.
+_MAX_ATTEMPTS = 3
+_BACKOFF_BASE = 1.0
+_BACKOFF_MAX = 3.0
+_BACKOFF_JITTER = 0.5
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Seconds to wait after the given zero-based failed attempt."""
+    delay = _BACKOFF_BASE * 2**attempt * (1 + random.random() * _BACKOFF_JITTER)
+    return min(delay, _BACKOFF_MAX)
 
 
 class OAuthClient:
@@ -19,6 +32,7 @@ class OAuthClient:
     ) -> None:
         self.client_id = client_id
         self.client_secret = client_secret
+        self._auth = BasicAuth(client_id, client_secret)
         self._access_token: str | None = None
         self._request_time = 0.0
         self._token_life = 240.0  # Token expires after 4 minutes
@@ -28,24 +42,23 @@ class OAuthClient:
     def invalidate_token(self) -> None:
         self._access_token = None
 
-    @retry(
-        retry=retry_if_exception_type(
-            (aiohttp.ClientConnectionError),
-        ),
-        wait=wait_exponential(multiplier=1, min=1, max=3),
-        stop=stop_after_attempt(3),
-        reraise=True,
-    )
     async def _get_access_token(self) -> None:
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        data = {"grant_type": "client_credentials"}
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                await self._request_access_token()
+                return
+            except aiohttp.ClientConnectionError:
+                if attempt == _MAX_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(_backoff_delay(attempt))
 
+    async def _request_access_token(self) -> None:
         async with (
             self._session.post(
                 url=self.base_url,
-                headers=headers,
-                data=data,
-                auth=BasicAuth(self.client_id, self.client_secret),
+                headers=_FORM_HEADERS,
+                data=_GRANT_PAYLOAD,
+                auth=self._auth,
                 timeout=aiohttp.ClientTimeout(total=10),
             ) as response,
         ):
@@ -55,13 +68,13 @@ class OAuthClient:
             if not access_token:
                 raise ValueError("OAuth server returned no access_token")
             self._access_token = access_token
-            self._request_time = time.time()
+            self._request_time = time.monotonic()
 
     async def get_access_token(self) -> str:
         async with self._lock:
             if (
                 not self._access_token
-                or time.time() - self._request_time > self._token_life
+                or time.monotonic() - self._request_time > self._token_life
             ):
                 await self._get_access_token()
 
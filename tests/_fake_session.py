@@ -0,0 +1,26 @@
+"""Lightweight stand-in for aiohttp.ClientSession used by the OAuth tests."""
+
+from typing import Any
+from unittest.mock import MagicMock
+
+
+class FakeResponseContext:
+    """Async context manager yielding a response, or raising an exception."""
+
+    def __init__(self, response: Any) -> None:
+        self._response = response
+
+    async def __aenter__(self) -> Any:
+        if isinstance(self._response, BaseException):
+            raise self._response
+        return self._response
+
+    async def __aexit__(self, *exc_info: object) -> bool:
+        return False
+
+
+class FakeSession:
+    """Only exposes `post`, as a plain MagicMock so call assertions still work."""
+
+    def __init__(self) -> None:
+        self.post = MagicMock()
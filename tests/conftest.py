@@ -0,0 +1,48 @@
+"""Shared fixtures for the test suite."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+
+class DummyOAuth:
+    """Stateless OAuth stand-in that always hands out the same token."""
+
+    async def get_access_token(self):
+        return "test_token"
+
+    def invalidate_token(self) -> None:
+        pass
+
+    @property
+    async def headers(self):
+        return {"Authorization": "Bearer test_token"}
+
+
+_DUMMY_OAUTH = DummyOAuth()
+
+
+@pytest.fixture
+def mock_session():
+    """Create a mock aiohttp.ClientSession without spec introspection."""
+    # request() is synchronous and returns an async context manager, which a
+    # MagicMock models out of the box.
+    return MagicMock()
+
+
+@pytest.fixture(scope="session")
+def dummy_oauth():
+    """Share one dummy OAuth client across the test session."""
+    return _DUMMY_OAUTH
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_pydantic_schemas():
+    """Finish building schema models whose validators pydantic deferred."""
+    # These generated models reference classes defined later in their module,
+    # so pydantic postpones building them until first validation.
+    from brightcove_async.schemas.analytics_model import TimelineWithDuration
+    from brightcove_async.schemas.dynamic_ingest_model import IngestMediaAssetbody
+
+    for model in (TimelineWithDuration, IngestMediaAssetbody):
+        model.model_rebuild()
@@ -1,6 +1,5 @@
 from unittest.mock import AsyncMock, patch
 
-import aiohttp
 import pytest
 
 from brightcove_async.schemas.analytics_model import (
@@ -15,29 +14,6 @@ from brightcove_async.schemas.params import GetAnalyticsReportParams
 from brightcove_async.services.analytics import Analytics
 
 
-class DummyOAuth:
-    """Dummy OAuth class for testing."""
-
-    async def get_access_token(self):
-        return "test_token"
-
-    @property
-    async def headers(self):
-        return {"Authorization": "Bearer test_token"}
-
-
-@pytest.fixture
-def mock_session():
-    """Create a mock aiohttp.ClientSession."""
-    return AsyncMock(spec=aiohttp.ClientSession)
-
-
-@pytest.fixture
-def dummy_oauth():
-    """Create a dummy OAuth client."""
-    return DummyOAuth()
-
-
 @pytest.fixture
 def analytics_service(mock_session, dummy_oauth):
     """Create an Analytics service instance for testing."""
@@ -55,7 +31,6 @@ def test_analytics_initialization(analytics_service):
     assert analytics_service.base_url == "https://analytics.api.brightcove.com/v1"
 
 
-@pytest.mark.asyncio
 async def test_get_account_engagement(analytics_service):
     """Test get_account_engagement method."""
     with patch.object(
@@ -65,7 +40,7 @@ async def test_get_account_engagement(analytics_service):
     ) as mock_fetch:
         from unittest.mock import MagicMock
 
-        mock_fetch.return_value = MagicMock(spec=Timeline)
+        mock_fetch.return_value = MagicMock()
 
         await analytics_service.get_account_engagement("account123")
 
@@ -75,7 +50,6 @@ async def test_get_account_engagement(analytics_service):
         assert call_args.kwargs["model"] == Timeline
 
 
-@pytest.mark.asyncio
 async def test_get_player_engagement(analytics_service):
     """Test get_player_engagement method."""
     with patch.object(
@@ -85,7 +59,7 @@ async def test_get_player_engagement(analytics_service):
     ) as mock_fetch:
         from unittest.mock import MagicMock
 
-        mock_fetch.return_value = MagicMock(spec=Timeline)
+        mock_fetch.return_value = MagicMock()
 
         await analytics_service.get_player_engagement(
             "account123",
@@ -99,7 +73,6 @@ async def test_get_player_engagement(analytics_service):
         assert call_args.kwargs["model"] == Timeline
 
 
-@pytest.mark.asyncio
 async def test_get_video_engagement(analytics_service):
     """Test get_video_engagement method."""
     with patch.object(
@@ -109,7 +82,7 @@ async def test_get_video_engagement(analytics_service):
     ) as mock_fetch:
         from unittest.mock import MagicMock
 
-        mock_fetch.return_value = MagicMock(spec=TimelineWithDuration)
+        mock_fetch.return_value = MagicMock()
 
         await analytics_service.get_video_engagement("account123", "video789")
 
@@ -120,7 +93,6 @@ async def test_get_video_engagement(analytics_service):
         assert call_args.kwargs["model"] == TimelineWithDuration
 
 
-@pytest.mark.asyncio
 async def test_get_analytics_report(analytics_service):
     """Test get_analytics_report method."""
     with patch.object(
@@ -148,7 +120,6 @@ async def test_get_analytics_report(analytics_service):
         assert call_args.kwargs["params"] is not None
 
 
-@pytest.mark.asyncio
 async def test_get_available_date_range(analytics_service):
     """Test get_available_date_range method."""
     with patch.object(
@@ -174,7 +145,6 @@ async def test_get_available_date_range(analytics_service):
         assert call_args.kwargs["model"] == GetAvailableDateRangeResponse
 
 
-@pytest.mark.asyncio
 async def test_get_alltime_video_views(analytics_service):
     """Test get_alltime_video_views method."""
     with patch.object(
@@ -196,7 +166,6 @@ async def test_get_alltime_video_views(analytics_service):
         assert call_args.kwargs["model"] == GetAlltimeVideoViewsResponse
 
 
-@pytest.mark.asyncio
 async def test_base_url_property(analytics_service):
     """Test base_url property returns correct URL."""
     assert analytics_service.base_url == "https://analytics.api.brightcove.com/v1"
@@ -1,6 +1,5 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import aiohttp
 import pytest
 
 from brightcove_async.schemas.audience_model import (
@@ -11,25 +10,6 @@ from brightcove_async.schemas.params import GetLeadsParams, GetViewEventsParams
 from brightcove_async.services.audience import Audience
 
 
-class DummyOAuth:
-    async def get_access_token(self):
-        return "test_token"
-
-    @property
-    async def headers(self):
-        return {"Authorization": "Bearer test_token"}
-
-
-@pytest.fixture
-def mock_session():
-    return AsyncMock(spec=aiohttp.ClientSession)
-
-
-@pytest.fixture
-def dummy_oauth():
-    return DummyOAuth()
-
-
 @pytest.fixture
 def audience_service(mock_session, dummy_oauth):
     return Audience(
@@ -45,12 +25,11 @@ def test_audience_initialization(audience_service):
     assert audience_service.base_url == "https://audience.api.brightcove.com/v1"
 
 
-@pytest.mark.asyncio
 async def test_get_leads(audience_service):
     with patch.object(
         audience_service, "fetch_data", new_callable=AsyncMock
     ) as mock_fetch:
-        mock_fetch.return_value = MagicMock(spec=GetLeadsResponse)
+        mock_fetch.return_value = MagicMock()
 
         await audience_service.get_leads("account123")
 
@@ -62,12 +41,11 @@ async def test_get_leads(audience_service):
         assert call_args.kwargs["params"] is None
 
 
-@pytest.mark.asyncio
 async def test_get_leads_with_params(audience_service):
     with patch.object(
         audience_service, "fetch_data", new_callable=AsyncMock
     ) as mock_fetch:
-        mock_fetch.return_value = MagicMock(spec=GetLeadsResponse)
+        mock_fetch.return_value = MagicMock()
 
         params = GetLeadsParams(limit=10, offset=5, sort="created_at")
         await audience_service.get_leads("account123", params=params)
@@ -81,12 +59,11 @@ async def test_get_leads_with_params(audience_service):
         }
 
 
-@pytest.mark.asyncio
 async def test_get_view_events(audience_service):
     with patch.object(
         audience_service, "fetch_data", new_callable=AsyncMock
     ) as mock_fetch:
-        mock_fetch.return_value = MagicMock(spec=GetViewEventsResponse)
+        mock_fetch.return_value = MagicMock()
 
         await audience_service.get_view_events("account123")
 
@@ -98,12 +75,11 @@ async def test_get_view_events(audience_service):
         assert call_args.kwargs["params"] is None
 
 
-@pytest.mark.asyncio
 async def test_get_view_events_with_params(audience_service):
     with patch.object(
         audience_service, "fetch_data", new_callable=AsyncMock
     ) as mock_fetch:
-        mock_fetch.return_value = MagicMock(spec=GetViewEventsResponse)
+        mock_fetch.return_value = MagicMock()
 
         params = GetViewEventsParams(limit=50, where="video_id==abc123")
         await audience_service.get_view_events("account456", params=params)
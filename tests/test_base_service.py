@@ -20,36 +20,10 @@ class DummyModel(BaseModel):
     name: str
 
 
-class DummyOAuth:
-    """Dummy OAuth class for testing."""
-
-    async def get_access_token(self):
-        return "test_token"
-
-    def invalidate_token(self) -> None:
-        pass
-
-    @property
-    async def headers(self):
-        return {"Authorization": "Bearer test_token"}
-
-
 class DummyService(Base):
     """Concrete implementation of Base for testing."""
 
 
-@pytest.fixture
-def mock_session():
-    """Create a mock aiohttp.ClientSession."""
-    return AsyncMock(spec=aiohttp.ClientSession)
-
-
-@pytest.fixture
-def dummy_oauth():
-    """Create a dummy OAuth client."""
-    return DummyOAuth()
-
-
 @pytest.fixture
 def base_service(mock_session, dummy_oauth):
     """Create a Base service instance for testing."""
@@ -129,7 +103,6 @@ def test_max_requests_setter_invalid_value(base_service):
         base_service.max_requests = -5
 
 
-@pytest.mark.asyncio
 async def test_raise_for_status_passes_on_success(base_service):
     """Test _raise_for_status does not raise when response is successful."""
     mock_response = AsyncMock()
@@ -142,7 +115,6 @@ async def test_raise_for_status_passes_on_success(base_service):
     mock_response.raise_for_status.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_raise_for_status_maps_404(base_service):
     """Test _raise_for_status maps 404 to BrightcoveResourceNotFoundError."""
     error = aiohttp.ClientResponseError(
@@ -160,7 +132,6 @@ async def test_raise_for_status_maps_404(base_service):
     assert exc_info.value.details == {"response_body": "Not found"}
 
 
-@pytest.mark.asyncio
 async def test_raise_for_status_maps_400(base_service):
     """Test _raise_for_status maps 400 to BrightcoveBadValueError."""
     error = aiohttp.ClientResponseError(
@@ -176,7 +147,6 @@ async def test_raise_for_status_maps_400(base_service):
         )
 
 
-@pytest.mark.asyncio
 async def test_raise_for_status_includes_endpoint(base_service):
     """Test _raise_for_status includes the endpoint in the raised exception."""
     error = aiohttp.ClientResponseError(
@@ -193,7 +163,6 @@ async def test_raise_for_status_includes_endpoint(base_service):
     assert exc_info.value.endpoint == endpoint
 
 
-@pytest.mark.asyncio
 async def test_fetch_data_get_success(base_service, mock_session):
     """Test successful GET request with fetch_data."""
     mock_response = AsyncMock()
@@ -218,7 +187,6 @@ async def test_fetch_data_get_success(base_service, mock_session):
     assert call_args[0][1] == "https://api.example.com/v1/items/1"
 
 
-@pytest.mark.asyncio
 async def test_fetch_data_post_with_json(base_service, mock_session):
     """Test POST request with JSON body."""
     mock_response = AsyncMock()
@@ -243,7 +211,6 @@ async def test_fetch_data_post_with_json(base_service, mock_session):
     assert call_kwargs["json"] == {"id": 2, "name": "Created"}
 
 
-@pytest.mark.asyncio
 async def test_fetch_data_with_params(base_service, mock_session):
     """Test request with query parameters."""
     mock_response = AsyncMock()
@@ -262,7 +229,6 @@ async def test_fetch_data_with_params(base_service, mock_session):
     assert call_kwargs["params"] == {"filter": "active", "limit": 10}
 
 
-@pytest.mark.asyncio
 async def test_fetch_data_uses_oauth_headers(base_service, mock_session, dummy_oauth):
     """Test that OAuth headers are used by default."""
     mock_response = AsyncMock()
@@ -280,7 +246,6 @@ async def test_fetch_data_uses_oauth_headers(base_service, mock_session, dummy_o
     assert call_kwargs["headers"] == {"Authorization": "Bearer test_token"}
 
 
-@pytest.mark.asyncio
 async def test_fetch_data_custom_headers(base_service, mock_session):
     """Test using custom headers overrides OAuth headers."""
     mock_response = AsyncMock()
@@ -301,7 +266,6 @@ async def test_fetch_data_custom_headers(base_service, mock_session):
     assert call_kwargs["headers"] == custom_headers
 
 
-@pytest.mark.asyncio
 async def test_fetch_data_handles_404_error(base_service, mock_session):
     """Test that 404 errors are mapped to correct exception."""
     from unittest.mock import MagicMock
@@ -325,7 +289,6 @@ async def test_fetch_data_handles_404_error(base_service, mock_session):
         )
 
 
-@pytest.mark.asyncio
 async def test_fetch_data_handles_400_error(base_service, mock_session):
     """Test that 400 errors are mapped to correct exception."""
     from unittest.mock import MagicMock
@@ -349,7 +312,6 @@ async def test_fetch_data_handles_400_error(base_service, mock_session):
         )
 
 
-@pytest.mark.asyncio
 async def test_fetch_data_handles_401_error(base_service, mock_session):
     """Test that 401 errors are mapped to correct exception and retried."""
     from unittest.mock import MagicMock
@@ -376,7 +338,6 @@ async def test_fetch_data_handles_401_error(base_service, mock_session):
     assert mock_session.request.call_count == 2
 
 
-@pytest.mark.asyncio
 async def test_fetch_data_translates_connection_error(base_service, mock_session):
     """Test that aiohttp.ClientConnectionError is translated to BrightcoveConnectionError."""
     mock_session.request.return_value.__aenter__.side_effect = (
@@ -396,7 +357,6 @@ async def test_fetch_data_translates_connection_error(base_service, mock_session
     )
 
 
-@pytest.mark.asyncio
 async def test_fetch_data_retries_on_connection_error(base_service, mock_session):
     """Test that connection errors trigger retry mechanism."""
     mock_response = AsyncMock()
@@ -418,7 +378,6 @@ async def test_fetch_data_retries_on_connection_error(base_service, mock_session
     assert mock_session.request.call_count == 2
 
 
-@pytest.mark.asyncio
 async def test_fetch_data_retries_on_auth_error(base_service, mock_session):
     """Test that auth errors trigger retry mechanism."""
     mock_response = AsyncMock()
@@ -440,7 +399,6 @@ async def test_fetch_data_retries_on_auth_error(base_service, mock_session):
     assert mock_session.request.call_count == 2
 
 
-@pytest.mark.asyncio
 async def test_fetch_data_excludes_none_values_from_json(base_service, mock_session):
     """Test that None values are excluded from JSON body."""
     mock_response = AsyncMock()
@@ -469,7 +427,6 @@ async def test_fetch_data_excludes_none_values_from_json(base_service, mock_sess
     assert call_kwargs["json"] == {"id": 8, "name": "Test"}
 
 
-@pytest.mark.asyncio
 async def test_raise_for_status_429_extracts_retry_after(base_service):
     """Test that a 429 with Retry-After header populates retry_after on the exception."""
     from brightcove_async.exceptions import BrightcoveTooManyRequestsError
@@ -490,7 +447,6 @@ async def test_raise_for_status_429_extracts_retry_after(base_service):
     assert exc_info.value.retry_after == 10.0
 
 
-@pytest.mark.asyncio
 async def test_raise_for_status_429_no_retry_after(base_service):
     """Test that a 429 without Retry-After sets retry_after to None."""
     from brightcove_async.exceptions import BrightcoveTooManyRequestsError
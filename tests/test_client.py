@@ -20,7 +20,6 @@ class DummyOAuth:
         return {"Authorization": f"Bearer {await self.get_access_token()}"}
 
 
-@pytest.mark.asyncio
 async def test_context_manager_initializes_and_closes_session():
     from brightcove_async.registry import ServiceConfig
     from brightcove_async.services.cms import CMS
@@ -48,7 +47,6 @@ async def test_context_manager_initializes_and_closes_session():
         assert client._session is None
 
 
-@pytest.mark.asyncio
 async def test_oauth_property_lazy_instantiates():
     from brightcove_async.registry import ServiceConfig
     from brightcove_async.services.cms import CMS
@@ -74,7 +72,6 @@ async def test_oauth_property_lazy_instantiates():
             assert c._oauth is oauth
 
 
-@pytest.mark.asyncio
 async def test_services_are_lazy_loaded_and_singleton():
     from brightcove_async.registry import ServiceConfig
     from brightcove_async.services.analytics import Analytics
@@ -128,7 +125,6 @@ async def test_services_are_lazy_loaded_and_singleton():
             assert ana1 is ana2
 
 
-@pytest.mark.asyncio
 async def test_accessing_services_without_context_manager_raises():
     from brightcove_async.registry import ServiceConfig
     from brightcove_async.services.analytics import Analytics
@@ -157,7 +153,6 @@ async def test_accessing_services_without_context_manager_raises():
         _ = client.oauth
 
 
-@pytest.mark.asyncio
 async def test_client_with_external_session():
     """Test client with externally provided session."""
     from brightcove_async.registry import ServiceConfig
@@ -186,7 +181,6 @@ async def test_client_with_external_session():
     external_session.close.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_client_aexit_clears_services_and_oauth():
     """Test that __aexit__ clears services and oauth."""
     from brightcove_async.registry import ServiceConfig
@@ -219,7 +213,6 @@ async def test_client_aexit_clears_services_and_oauth():
         assert len(client._services) == 0
 
 
-@pytest.mark.asyncio
 async def test_get_service_returns_same_instance():
     """Test _get_service returns singleton instances."""
     from brightcove_async.registry import ServiceConfig
@@ -247,7 +240,6 @@ async def test_get_service_returns_same_instance():
             assert service1 is service2
 
 
-@pytest.mark.asyncio
 async def test_client_service_properties_are_distinct():
     """Test service properties return distinct instances."""
     from brightcove_async.registry import ServiceConfig
@@ -279,7 +271,6 @@ async def test_client_service_properties_are_distinct():
             assert cms is not analytics
 
 
-@pytest.mark.asyncio
 async def test_client_reentry_creates_new_session():
     """Test that re-entering context manager creates new session."""
     from brightcove_async.registry import ServiceConfig
@@ -319,7 +310,6 @@ async def test_client_reentry_creates_new_session():
         sessions[1].close.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_external_session_reusable_across_context_entries():
     """Re-entering with an external session after exit should restore the session."""
     from brightcove_async.registry import ServiceConfig
@@ -1,6 +1,5 @@
 from unittest.mock import AsyncMock, patch
 
-import aiohttp
 import pytest
 
 from brightcove_async.schemas.cms_model import (
@@ -24,7 +23,6 @@ from brightcove_async.schemas.cms_model import (
     FolderCreateFields,
     FolderList,
     FolderUpdateFields,
-    ImageList,
     IngestJobs,
     IngestJobStatus,
     LabelPath,
@@ -64,29 +62,6 @@ from brightcove_async.schemas.params import (
 from brightcove_async.services.cms import CMS
 
 
-class DummyOAuth:
-    """Dummy OAuth class for testing."""
-
-    async def get_access_token(self):
-        return "test_token"
-
-    @property
-    async def headers(self):
-        return {"Authorization": "Bearer test_token"}
-
-
-@pytest.fixture
-def mock_session():
-    """Create a mock aiohttp.ClientSession."""
-    return AsyncMock(spec=aiohttp.ClientSession)
-
-
-@pytest.fixture
-def dummy_oauth():
-    """Create a dummy OAuth client."""
-    return DummyOAuth()
-
-
 @pytest.fixture
 def cms_service(mock_session, dummy_oauth):
     """Create a CMS service instance for testing."""
@@ -98,7 +73,6 @@ def cms_service(mock_session, dummy_oauth):
     )
 
 
-@pytest.mark.asyncio
 async def test_cms_initialization(cms_service):
     """Test CMS service initializes with correct parameters."""
     assert cms_service._limit == 4
@@ -109,7 +83,6 @@ async def test_cms_initialization(cms_service):
 # ── Videos ────────────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_videos(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = VideoArray(root=[])
@@ -121,7 +94,6 @@ async def test_get_videos(cms_service):
         assert call_args.kwargs["model"] == VideoArray
 
 
-@pytest.mark.asyncio
 async def test_create_video(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Video(
@@ -135,7 +107,6 @@ async def test_create_video(cms_service):
         assert call_args.kwargs["payload"] == video_data
 
 
-@pytest.mark.asyncio
 async def test_update_video(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Video()
@@ -147,7 +118,6 @@ async def test_update_video(cms_service):
         assert call_args.kwargs["model"] == Video
 
 
-@pytest.mark.asyncio
 async def test_delete_video(cms_service):
     with patch.object(cms_service, "_delete", new_callable=AsyncMock) as mock_delete:
         await cms_service.delete_video("account123", ["v1", "v2"])
@@ -155,13 +125,11 @@ async def test_delete_video(cms_service):
         assert "v1,v2" in mock_delete.call_args.args[0]
 
 
-@pytest.mark.asyncio
 async def test_delete_video_empty_raises(cms_service):
     with pytest.raises(ValueError, match="at least one ID"):
         await cms_service.delete_video("account123", [])
 
 
-@pytest.mark.asyncio
 async def test_get_video_count(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = VideoCount(count=100)
@@ -169,7 +137,6 @@ async def test_get_video_count(cms_service):
         assert result.count == 100
 
 
-@pytest.mark.asyncio
 async def test_get_video_by_id_single(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = VideoArray(root=[])
@@ -177,7 +144,6 @@ async def test_get_video_by_id_single(cms_service):
         assert "video123" in mock_fetch.call_args.kwargs["endpoint"]
 
 
-@pytest.mark.asyncio
 async def test_get_video_by_id_multiple(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = VideoArray(root=[])
@@ -185,7 +151,6 @@ async def test_get_video_by_id_multiple(cms_service):
         assert "video1,video2,video3" in mock_fetch.call_args.kwargs["endpoint"]
 
 
-@pytest.mark.asyncio
 async def test_get_video_by_id_too_many_ids(cms_service):
     with pytest.raises(ValueError, match="video_ids must contain 10 or fewer IDs"):
         await cms_service.get_video_by_id(
@@ -193,13 +158,11 @@ async def test_get_video_by_id_too_many_ids(cms_service):
         )
 
 
-@pytest.mark.asyncio
 async def test_get_video_by_id_empty_list(cms_service):
     with pytest.raises(ValueError, match="video_ids must contain at least one ID"):
         await cms_service.get_video_by_id("account123", [])
 
 
-@pytest.mark.asyncio
 async def test_get_video_sources(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = VideoSourcesList(root=[])
@@ -207,24 +170,21 @@ async def test_get_video_sources(cms_service):
         assert "video123/sources" in mock_fetch.call_args.kwargs["endpoint"]
 
 
-@pytest.mark.asyncio
 async def test_get_video_images(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         from unittest.mock import MagicMock
 
-        mock_fetch.return_value = MagicMock(spec=ImageList)
+        mock_fetch.return_value = MagicMock()
         await cms_service.get_video_images("account123", "video123")
         assert "video123/images" in mock_fetch.call_args.kwargs["endpoint"]
 
 
-@pytest.mark.asyncio
 async def test_delete_video_image(cms_service):
     with patch.object(cms_service, "_delete", new_callable=AsyncMock) as mock_delete:
         await cms_service.delete_video_image("account123", "video123", "poster")
         assert "image_sources/poster" in mock_delete.call_args.args[0]
 
 
-@pytest.mark.asyncio
 async def test_get_clear_video(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Video()
@@ -233,7 +193,6 @@ async def test_get_clear_video(cms_service):
         assert mock_fetch.call_args.kwargs["model"] == Video
 
 
-@pytest.mark.asyncio
 async def test_get_video_clear_sources(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = VideoSourcesList(root=[])
@@ -245,7 +204,6 @@ async def test_get_video_clear_sources(cms_service):
 # ── Video Variants ─────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_video_variants(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = VideoVariants(root=[])
@@ -253,7 +211,6 @@ async def test_get_video_variants(cms_service):
         mock_fetch.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_create_video_variant(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = VideoVariant()
@@ -264,7 +221,6 @@ async def test_create_video_variant(cms_service):
         assert call_args.kwargs["method"] == "POST"
 
 
-@pytest.mark.asyncio
 async def test_get_video_variant(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = VideoVariant()
@@ -272,7 +228,6 @@ async def test_get_video_variant(cms_service):
         assert "variant123" in mock_fetch.call_args.kwargs["endpoint"]
 
 
-@pytest.mark.asyncio
 async def test_update_video_variant(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = VideoVariant()
@@ -283,7 +238,6 @@ async def test_update_video_variant(cms_service):
         assert call_args.kwargs["method"] == "PATCH"
 
 
-@pytest.mark.asyncio
 async def test_delete_video_variant(cms_service):
     with patch.object(cms_service, "_delete", new_callable=AsyncMock) as mock_delete:
         await cms_service.delete_video_variant("account123", "video123", "es-ES")
@@ -293,7 +247,6 @@ async def test_delete_video_variant(cms_service):
 # ── Audio Tracks ───────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_video_audio_tracks(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = AudioTracks(root=[])
@@ -301,7 +254,6 @@ async def test_get_video_audio_tracks(cms_service):
         mock_fetch.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_get_video_audio_track(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = AudioTrack()
@@ -309,7 +261,6 @@ async def test_get_video_audio_track(cms_service):
         mock_fetch.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_update_video_audio_track(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = AudioTrack()
@@ -322,7 +273,6 @@ async def test_update_video_audio_track(cms_service):
         assert call_args.kwargs["method"] == "PATCH"
 
 
-@pytest.mark.asyncio
 async def test_delete_video_audio_track(cms_service):
     with patch.object(cms_service, "_delete", new_callable=AsyncMock) as mock_delete:
         await cms_service.delete_video_audio_track("account123", "video123", "track123")
@@ -332,7 +282,6 @@ async def test_delete_video_audio_track(cms_service):
 # ── Digital Master ─────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_digital_master_info(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = DigitalMaster()
@@ -340,7 +289,6 @@ async def test_get_digital_master_info(cms_service):
         mock_fetch.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_delete_digital_master(cms_service):
     with patch.object(cms_service, "_delete", new_callable=AsyncMock) as mock_delete:
         await cms_service.delete_digital_master("account123", "video123")
@@ -350,7 +298,6 @@ async def test_delete_digital_master(cms_service):
 # ── Ingest Jobs ────────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_status_of_ingest_jobs(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = IngestJobs(root=[])
@@ -358,7 +305,6 @@ async def test_get_status_of_ingest_jobs(cms_service):
         mock_fetch.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_get_ingest_job_status(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = IngestJobStatus()
@@ -369,7 +315,6 @@ async def test_get_ingest_job_status(cms_service):
 # ── Playlist References ────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_playlists_for_video(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = PlaylistReferences()
@@ -379,7 +324,6 @@ async def test_get_playlists_for_video(cms_service):
         assert call_args.kwargs["model"] == PlaylistReferences
 
 
-@pytest.mark.asyncio
 async def test_remove_video_from_all_playlists(cms_service):
     with patch.object(cms_service, "_delete", new_callable=AsyncMock) as mock_delete:
         await cms_service.remove_video_from_all_playlists("account123", "video123")
@@ -389,7 +333,6 @@ async def test_remove_video_from_all_playlists(cms_service):
 # ── Playlists ──────────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_playlists(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = PlaylistArray(root=[])
@@ -399,7 +342,6 @@ async def test_get_playlists(cms_service):
         assert call_args.kwargs["model"] == PlaylistArray
 
 
-@pytest.mark.asyncio
 async def test_create_playlist(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Playlist()
@@ -410,7 +352,6 @@ async def test_create_playlist(cms_service):
         assert call_args.kwargs["model"] == Playlist
 
 
-@pytest.mark.asyncio
 async def test_get_playlist_count(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = PlaylistCount(count=5)
@@ -419,7 +360,6 @@ async def test_get_playlist_count(cms_service):
         assert "counts/playlists" in mock_fetch.call_args.kwargs["endpoint"]
 
 
-@pytest.mark.asyncio
 async def test_get_playlist(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Playlist()
@@ -427,7 +367,6 @@ async def test_get_playlist(cms_service):
         assert "playlist123" in mock_fetch.call_args.kwargs["endpoint"]
 
 
-@pytest.mark.asyncio
 async def test_update_playlist(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Playlist()
@@ -438,14 +377,12 @@ async def test_update_playlist(cms_service):
         assert call_args.kwargs["method"] == "PATCH"
 
 
-@pytest.mark.asyncio
 async def test_delete_playlist(cms_service):
     with patch.object(cms_service, "_delete", new_callable=AsyncMock) as mock_delete:
         await cms_service.delete_playlist("account123", "playlist123")
         assert "playlist123" in mock_delete.call_args.args[0]
 
 
-@pytest.mark.asyncio
 async def test_get_videos_in_playlist(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = VideoArray(root=[])
@@ -455,7 +392,6 @@ async def test_get_videos_in_playlist(cms_service):
         assert call_args.kwargs["model"] == VideoArray
 
 
-@pytest.mark.asyncio
 async def test_get_video_count_in_playlist(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = VideoCountInPlaylist(count=3)
@@ -472,7 +408,6 @@ async def test_get_video_count_in_playlist(cms_service):
 # ── Custom Fields ──────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_all_video_fields(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = VideoFields()
@@ -482,7 +417,6 @@ async def test_get_all_video_fields(cms_service):
         assert call_args.kwargs["model"] == VideoFields
 
 
-@pytest.mark.asyncio
 async def test_get_video_fields(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = CustomFields(root=[])
@@ -490,7 +424,6 @@ async def test_get_video_fields(cms_service):
         assert "video_fields/custom_fields" in mock_fetch.call_args.kwargs["endpoint"]
 
 
-@pytest.mark.asyncio
 async def test_create_custom_field(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = CustomField()
@@ -501,7 +434,6 @@ async def test_create_custom_field(cms_service):
         assert call_args.kwargs["method"] == "POST"
 
 
-@pytest.mark.asyncio
 async def test_get_custom_field(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = CustomField()
@@ -509,7 +441,6 @@ async def test_get_custom_field(cms_service):
         assert "custom_fields/myfield" in mock_fetch.call_args.kwargs["endpoint"]
 
 
-@pytest.mark.asyncio
 async def test_update_custom_field(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = CustomField()
@@ -520,7 +451,6 @@ async def test_update_custom_field(cms_service):
         assert call_args.kwargs["method"] == "PATCH"
 
 
-@pytest.mark.asyncio
 async def test_delete_custom_field(cms_service):
     with patch.object(cms_service, "_delete", new_callable=AsyncMock) as mock_delete:
         await cms_service.delete_custom_field("account123", "myfield")
@@ -530,7 +460,6 @@ async def test_delete_custom_field(cms_service):
 # ── Folders ────────────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_folders(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = FolderList(root=[])
@@ -540,7 +469,6 @@ async def test_get_folders(cms_service):
         assert call_args.kwargs["model"] == FolderList
 
 
-@pytest.mark.asyncio
 async def test_create_folder(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Folder()
@@ -551,7 +479,6 @@ async def test_create_folder(cms_service):
         assert call_args.kwargs["model"] == Folder
 
 
-@pytest.mark.asyncio
 async def test_get_folder(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Folder()
@@ -559,7 +486,6 @@ async def test_get_folder(cms_service):
         assert "folders/folder123" in mock_fetch.call_args.kwargs["endpoint"]
 
 
-@pytest.mark.asyncio
 async def test_update_folder(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Folder()
@@ -570,14 +496,12 @@ async def test_update_folder(cms_service):
         assert call_args.kwargs["method"] == "PATCH"
 
 
-@pytest.mark.asyncio
 async def test_delete_folder(cms_service):
     with patch.object(cms_service, "_delete", new_callable=AsyncMock) as mock_delete:
         await cms_service.delete_folder("account123", "folder123")
         assert "folders/folder123" in mock_delete.call_args.args[0]
 
 
-@pytest.mark.asyncio
 async def test_get_videos_in_folder(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = VideoArray(root=[])
@@ -585,14 +509,12 @@ async def test_get_videos_in_folder(cms_service):
         assert "folder123/videos" in mock_fetch.call_args.kwargs["endpoint"]
 
 
-@pytest.mark.asyncio
 async def test_add_video_to_folder(cms_service):
     with patch.object(cms_service, "_put_empty", new_callable=AsyncMock) as mock_put:
         await cms_service.add_video_to_folder("account123", "folder123", "video123")
         assert "folder123/videos/video123" in mock_put.call_args.args[0]
 
 
-@pytest.mark.asyncio
 async def test_remove_video_from_folder(cms_service):
     with patch.object(cms_service, "_delete", new_callable=AsyncMock) as mock_delete:
         await cms_service.remove_video_from_folder(
@@ -604,7 +526,6 @@ async def test_remove_video_from_folder(cms_service):
 # ── Labels ─────────────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_labels(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = LabelsList()
@@ -614,7 +535,6 @@ async def test_get_labels(cms_service):
         assert call_args.kwargs["model"] == LabelsList
 
 
-@pytest.mark.asyncio
 async def test_create_label(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = LabelsList()
@@ -625,7 +545,6 @@ async def test_create_label(cms_service):
         assert call_args.kwargs["model"] == LabelsList
 
 
-@pytest.mark.asyncio
 async def test_update_label(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = LabelsList()
@@ -636,7 +555,6 @@ async def test_update_label(cms_service):
         assert call_args.kwargs["method"] == "PATCH"
 
 
-@pytest.mark.asyncio
 async def test_delete_label(cms_service):
     with patch.object(cms_service, "_delete", new_callable=AsyncMock) as mock_delete:
         await cms_service.delete_label("account123", "nature/birds")
@@ -646,7 +564,6 @@ async def test_delete_label(cms_service):
 # ── Channels ───────────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_list_channels(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = ChannelList(root=[])
@@ -654,7 +571,6 @@ async def test_list_channels(cms_service):
         mock_fetch.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_get_channel_details(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Channel()
@@ -662,7 +578,6 @@ async def test_get_channel_details(cms_service):
         mock_fetch.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_update_channel(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Channel()
@@ -674,7 +589,6 @@ async def test_update_channel(cms_service):
         assert call_args.kwargs["model"] == Channel
 
 
-@pytest.mark.asyncio
 async def test_list_channel_affiliates(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = ChannelAffiliateList(root=[])
@@ -682,7 +596,6 @@ async def test_list_channel_affiliates(cms_service):
         mock_fetch.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_add_affiliate(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = AddAffiliate(account_id="affiliate456")
@@ -695,7 +608,6 @@ async def test_add_affiliate(cms_service):
         assert call_args.kwargs["model"] == AddAffiliate
 
 
-@pytest.mark.asyncio
 async def test_remove_affiliate(cms_service):
     with patch.object(cms_service, "_delete", new_callable=AsyncMock) as mock_delete:
         await cms_service.remove_affiliate("account123", "my_channel", "affiliate456")
@@ -707,7 +619,6 @@ async def test_remove_affiliate(cms_service):
 # ── Contracts ──────────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_list_contracts(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = ContractList(root=[])
@@ -717,7 +628,6 @@ async def test_list_contracts(cms_service):
         assert call_args.kwargs["model"] == ContractList
 
 
-@pytest.mark.asyncio
 async def test_get_contract(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Contract()
@@ -727,7 +637,6 @@ async def test_get_contract(cms_service):
         assert call_args.kwargs["model"] == Contract
 
 
-@pytest.mark.asyncio
 async def test_approve_contract(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Contract()
@@ -742,7 +651,6 @@ async def test_approve_contract(cms_service):
 # ── Video Shares ───────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_list_shares(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = VideoShareList(root=[])
@@ -750,7 +658,6 @@ async def test_list_shares(cms_service):
         mock_fetch.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_share_video(cms_service):
     with (
         patch.object(cms_service, "_send_request", new_callable=AsyncMock) as mock_req,
@@ -767,7 +674,6 @@ async def test_share_video(cms_service):
         assert mock_req.call_args.kwargs["json_body"] == [{"id": "affiliate456"}]
 
 
-@pytest.mark.asyncio
 async def test_get_share(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = VideoShare(
@@ -779,7 +685,6 @@ async def test_get_share(cms_service):
         assert "shares/affiliate456" in mock_fetch.call_args.kwargs["endpoint"]
 
 
-@pytest.mark.asyncio
 async def test_unshare_video(cms_service):
     with patch.object(cms_service, "_delete", new_callable=AsyncMock) as mock_delete:
         await cms_service.unshare_video("account123", "video123", "affiliate456")
@@ -789,7 +694,6 @@ async def test_unshare_video(cms_service):
 # ── Subscriptions ──────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_subscriptions(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = SubscriptionList(root=[])
@@ -799,7 +703,6 @@ async def test_get_subscriptions(cms_service):
         assert call_args.kwargs["model"] == SubscriptionList
 
 
-@pytest.mark.asyncio
 async def test_create_subscription(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Subscription()
@@ -815,7 +718,6 @@ async def test_create_subscription(cms_service):
         assert call_args.kwargs["model"] == Subscription
 
 
-@pytest.mark.asyncio
 async def test_get_subscription(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Subscription()
@@ -823,7 +725,6 @@ async def test_get_subscription(cms_service):
         assert "subscriptions/sub123" in mock_fetch.call_args.kwargs["endpoint"]
 
 
-@pytest.mark.asyncio
 async def test_delete_subscription(cms_service):
     with patch.object(cms_service, "_delete", new_callable=AsyncMock) as mock_delete:
         await cms_service.delete_subscription("account123", "sub123")
@@ -833,7 +734,6 @@ async def test_delete_subscription(cms_service):
 # ── Assets ─────────────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_assets(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = VideoAssetList(root=[])
@@ -843,7 +743,6 @@ async def test_get_assets(cms_service):
         assert call_args.kwargs["model"] == VideoAssetList
 
 
-@pytest.mark.asyncio
 async def test_get_dynamic_renditions(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = DynamicRenditionList(root=[])
@@ -854,7 +753,6 @@ async def test_get_dynamic_renditions(cms_service):
 # ── HLS Manifests ──────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_hls_manifests(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = ManifestList(root=[])
@@ -863,7 +761,6 @@ async def test_get_hls_manifests(cms_service):
         assert mock_fetch.call_args.kwargs["model"] == ManifestList
 
 
-@pytest.mark.asyncio
 async def test_add_hls_manifest(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Manifest()
@@ -874,7 +771,6 @@ async def test_add_hls_manifest(cms_service):
         assert call_args.kwargs["method"] == "POST"
 
 
-@pytest.mark.asyncio
 async def test_get_hls_manifest(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Manifest()
@@ -882,7 +778,6 @@ async def test_get_hls_manifest(cms_service):
         assert "hls_manifest/asset123" in mock_fetch.call_args.kwargs["endpoint"]
 
 
-@pytest.mark.asyncio
 async def test_update_hls_manifest(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Manifest()
@@ -895,7 +790,6 @@ async def test_update_hls_manifest(cms_service):
         assert call_args.kwargs["method"] == "PATCH"
 
 
-@pytest.mark.asyncio
 async def test_delete_hls_manifest(cms_service):
     with patch.object(cms_service, "_delete", new_callable=AsyncMock) as mock_delete:
         await cms_service.delete_hls_manifest("account123", "video123", "asset123")
@@ -905,7 +799,6 @@ async def test_delete_hls_manifest(cms_service):
 # ── DASH Manifests ─────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_dash_manifests(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = ManifestList(root=[])
@@ -913,7 +806,6 @@ async def test_get_dash_manifests(cms_service):
         assert "dash_manifests" in mock_fetch.call_args.kwargs["endpoint"]
 
 
-@pytest.mark.asyncio
 async def test_add_dash_manifest(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Manifest()
@@ -922,7 +814,6 @@ async def test_add_dash_manifest(cms_service):
         assert mock_fetch.call_args.kwargs["method"] == "POST"
 
 
-@pytest.mark.asyncio
 async def test_get_dash_manifest(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Manifest()
@@ -930,7 +821,6 @@ async def test_get_dash_manifest(cms_service):
         assert "dash_manifests/asset123" in mock_fetch.call_args.kwargs["endpoint"]
 
 
-@pytest.mark.asyncio
 async def test_update_dash_manifest(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Manifest()
@@ -941,7 +831,6 @@ async def test_update_dash_manifest(cms_service):
         assert mock_fetch.call_args.kwargs["method"] == "PATCH"
 
 
-@pytest.mark.asyncio
 async def test_delete_dash_manifest(cms_service):
     with patch.object(cms_service, "_delete", new_callable=AsyncMock) as mock_delete:
         await cms_service.delete_dash_manifest("account123", "video123", "asset123")
@@ -951,7 +840,6 @@ async def test_delete_dash_manifest(cms_service):
 # ── HDS Manifests ──────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_hds_manifests(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = ManifestList(root=[])
@@ -959,7 +847,6 @@ async def test_get_hds_manifests(cms_service):
         assert "hds_manifest" in mock_fetch.call_args.kwargs["endpoint"]
 
 
-@pytest.mark.asyncio
 async def test_add_hds_manifest(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Manifest()
@@ -968,7 +855,6 @@ async def test_add_hds_manifest(cms_service):
         assert mock_fetch.call_args.kwargs["method"] == "POST"
 
 
-@pytest.mark.asyncio
 async def test_get_hds_manifest(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Manifest()
@@ -976,7 +862,6 @@ async def test_get_hds_manifest(cms_service):
         assert "hds_manifest/asset123" in mock_fetch.call_args.kwargs["endpoint"]
 
 
-@pytest.mark.asyncio
 async def test_update_hds_manifest(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Manifest()
@@ -987,7 +872,6 @@ async def test_update_hds_manifest(cms_service):
         assert mock_fetch.call_args.kwargs["method"] == "PATCH"
 
 
-@pytest.mark.asyncio
 async def test_delete_hds_manifest(cms_service):
     with patch.object(cms_service, "_delete", new_callable=AsyncMock) as mock_delete:
         await cms_service.delete_hds_manifest("account123", "video123", "asset123")
@@ -997,7 +881,6 @@ async def test_delete_hds_manifest(cms_service):
 # ── ISM Manifests ──────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_ism_manifests(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = ManifestList(root=[])
@@ -1005,7 +888,6 @@ async def test_get_ism_manifests(cms_service):
         assert "ism_manifest" in mock_fetch.call_args.kwargs["endpoint"]
 
 
-@pytest.mark.asyncio
 async def test_add_ism_manifest(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Manifest()
@@ -1014,7 +896,6 @@ async def test_add_ism_manifest(cms_service):
         assert mock_fetch.call_args.kwargs["method"] == "POST"
 
 
-@pytest.mark.asyncio
 async def test_get_ism_manifest(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Manifest()
@@ -1022,7 +903,6 @@ async def test_get_ism_manifest(cms_service):
         assert "ism_manifest/asset123" in mock_fetch.call_args.kwargs["endpoint"]
 
 
-@pytest.mark.asyncio
 async def test_update_ism_manifest(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Manifest()
@@ -1033,7 +913,6 @@ async def test_update_ism_manifest(cms_service):
         assert mock_fetch.call_args.kwargs["method"] == "PATCH"
 
 
-@pytest.mark.asyncio
 async def test_delete_ism_manifest(cms_service):
     with patch.object(cms_service, "_delete", new_callable=AsyncMock) as mock_delete:
         await cms_service.delete_ism_manifest("account123", "video123", "asset123")
@@ -1043,7 +922,6 @@ async def test_delete_ism_manifest(cms_service):
 # ── ISMC Manifests ─────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_ismc_manifests(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = ManifestList(root=[])
@@ -1051,7 +929,6 @@ async def test_get_ismc_manifests(cms_service):
         assert "ismc_manifest" in mock_fetch.call_args.kwargs["endpoint"]
 
 
-@pytest.mark.asyncio
 async def test_add_ismc_manifest(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Manifest()
@@ -1060,7 +937,6 @@ async def test_add_ismc_manifest(cms_service):
         assert mock_fetch.call_args.kwargs["method"] == "POST"
 
 
-@pytest.mark.asyncio
 async def test_get_ismc_manifest(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Manifest()
@@ -1068,7 +944,6 @@ async def test_get_ismc_manifest(cms_service):
         assert "ismc_manifest/asset123" in mock_fetch.call_args.kwargs["endpoint"]
 
 
-@pytest.mark.asyncio
 async def test_update_ismc_manifest(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = Manifest()
@@ -1079,7 +954,6 @@ async def test_update_ismc_manifest(cms_service):
         assert mock_fetch.call_args.kwargs["method"] == "PATCH"
 
 
-@pytest.mark.asyncio
 async def test_delete_ismc_manifest(cms_service):
     with patch.object(cms_service, "_delete", new_callable=AsyncMock) as mock_delete:
         await cms_service.delete_ismc_manifest("account123", "video123", "asset123")
@@ -1089,7 +963,6 @@ async def test_delete_ismc_manifest(cms_service):
 # ── Renditions ─────────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_add_rendition(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = VideoAsset()
@@ -1101,7 +974,6 @@ async def test_add_rendition(cms_service):
         assert call_args.kwargs["model"] == VideoAsset
 
 
-@pytest.mark.asyncio
 async def test_get_rendition(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = VideoAsset()
@@ -1109,7 +981,6 @@ async def test_get_rendition(cms_service):
         assert "renditions/asset123" in mock_fetch.call_args.kwargs["endpoint"]
 
 
-@pytest.mark.asyncio
 async def test_update_rendition(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = VideoAsset()
@@ -1120,7 +991,6 @@ async def test_update_rendition(cms_service):
         assert call_args.kwargs["method"] == "PATCH"
 
 
-@pytest.mark.asyncio
 async def test_delete_rendition(cms_service):
     with patch.object(cms_service, "_delete", new_callable=AsyncMock) as mock_delete:
         await cms_service.delete_rendition("account123", "video123", "asset123")
@@ -1130,7 +1000,6 @@ async def test_delete_rendition(cms_service):
 # ── Paginated helpers ──────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_videos_for_account_pagination(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = VideoArray(root=[])
@@ -1140,7 +1009,6 @@ async def test_get_videos_for_account_pagination(cms_service):
         assert mock_fetch.call_count == 2
 
 
-@pytest.mark.asyncio
 async def test_get_videos_for_account_skips_count_when_pages_provided(cms_service):
     with patch.object(cms_service, "fetch_data", new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = VideoArray(root=[])
@@ -1154,7 +1022,6 @@ async def test_get_videos_for_account_skips_count_when_pages_provided(cms_servic
             assert mock_fetch.call_count == 2
 
 
-@pytest.mark.asyncio
 async def test_get_videos_for_account_no_results(cms_service):
     with patch.object(
         cms_service, "get_video_count", new_callable=AsyncMock
@@ -1164,7 +1031,6 @@ async def test_get_videos_for_account_no_results(cms_service):
         assert len(result.root) == 0
 
 
-@pytest.mark.asyncio
 async def test_get_videos_for_account_page_size_too_large(cms_service):
     with pytest.raises(ValueError, match="page_size must be less than or equal to 100"):
         await cms_service.get_videos_for_account("account123", page_size=101)
@@ -2,7 +2,6 @@
 
 from unittest.mock import AsyncMock, patch
 
-import aiohttp
 import pytest
 
 from brightcove_async.schemas.ingest_profiles_model import (
@@ -12,29 +11,6 @@ from brightcove_async.schemas.ingest_profiles_model import (
 from brightcove_async.services.ingest_profiles import IngestProfiles
 
 
-class DummyOAuth:
-    """Dummy OAuth class for testing."""
-
-    async def get_access_token(self):
-        return "test_token"
-
-    @property
-    async def headers(self):
-        return {"Authorization": "Bearer test_token"}
-
-
-@pytest.fixture
-def mock_session():
-    """Create a mock aiohttp.ClientSession."""
-    return AsyncMock(spec=aiohttp.ClientSession)
-
-
-@pytest.fixture
-def dummy_oauth():
-    """Create a dummy OAuth client."""
-    return DummyOAuth()
-
-
 @pytest.fixture
 def ingest_profiles_service(mock_session, dummy_oauth):
     """Create an IngestProfiles service instance for testing."""
@@ -51,7 +27,6 @@ def ingest_profiles_service(mock_session, dummy_oauth):
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_get_ingest_profiles_calls_fetch_data_with_correct_model(
     ingest_profiles_service,
 ):
@@ -70,7 +45,6 @@ async def test_get_ingest_profiles_calls_fetch_data_with_correct_model(
         assert "profiles" in call_args.kwargs["endpoint"]
 
 
-@pytest.mark.asyncio
 async def test_get_ingest_profiles_returns_ingest_profile_list(
     ingest_profiles_service,
 ):
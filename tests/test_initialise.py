@@ -1,4 +1,6 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
+
+import pytest
 
 from brightcove_async.client import BrightcoveClient
 from brightcove_async.initialise import initialise_brightcove_client
@@ -6,115 +8,86 @@ from brightcove_async.oauth.oauth import OAuthClient
 from brightcove_async.settings import BrightcoveBaseAPIConfig, BrightcoveOAuthCreds
 
 
-def test_initialise_brightcove_client_with_defaults():
-    """Test initialise_brightcove_client with default parameters."""
-    with (
-        patch("brightcove_async.initialise.BrightcoveOAuthCreds") as MockOAuthCreds,
-        patch("brightcove_async.initialise.BrightcoveBaseAPIConfig") as MockAPIConfig,
-    ):
-        mock_creds = MagicMock()
-        mock_creds.client_id = "test_id"
-        mock_creds.client_secret = MagicMock()
-        mock_creds.client_secret.get_secret_value.return_value = "test_secret"
-        MockOAuthCreds.return_value = mock_creds
-
-        mock_config = MagicMock()
-        MockAPIConfig.return_value = mock_config
-
-        with patch(
-            "brightcove_async.initialise.build_service_registry",
-        ) as mock_registry:
-            mock_registry.return_value = {}
+def _make_mock_creds(client_id: str, client_secret: str) -> MagicMock:
+    mock_creds = MagicMock(spec=BrightcoveOAuthCreds)
+    mock_creds.client_id = client_id
+    mock_creds.client_secret = MagicMock()
+    mock_creds.client_secret.get_secret_value.return_value = client_secret
+    return mock_creds
 
-            client = initialise_brightcove_client()
 
-            assert isinstance(client, BrightcoveClient)
-            MockOAuthCreds.assert_called_once()
-            MockAPIConfig.assert_called_once()
+CUSTOM_CREDS = _make_mock_creds("custom_id", "custom_secret")
 
+CUSTOM_CONFIG = BrightcoveBaseAPIConfig(
+    cms_base_url="https://custom-cms.example.com/",
+    syndication_base_url="https://custom-syndication.example.com/",
+)
 
-def test_initialise_brightcove_client_with_custom_creds():
-    """Test initialise_brightcove_client with custom OAuth credentials."""
-    with patch("brightcove_async.initialise.build_service_registry") as mock_registry:
-        mock_registry.return_value = {}
 
-        mock_creds = MagicMock(spec=BrightcoveOAuthCreds)
-        mock_creds.client_id = "custom_id"
-        mock_creds.client_secret = MagicMock()
-        mock_creds.client_secret.get_secret_value.return_value = "custom_secret"
+@pytest.fixture(scope="module")
+def default_mock_creds():
+    """Mock OAuth credentials shared by tests that don't inspect them."""
+    return _make_mock_creds("test_id", "test_secret")
 
-        client = initialise_brightcove_client(oauth_creds=mock_creds)
 
-        assert isinstance(client, BrightcoveClient)
-        assert client._client_id == "custom_id"
-        assert client._client_secret == "custom_secret"
+@pytest.fixture
+def patched_factories(monkeypatch, default_mock_creds):
+    """Patch the env-backed credentials and the service registry builder."""
+    MockOAuthCreds = MagicMock(return_value=default_mock_creds)
+    mock_registry = MagicMock(return_value={})
+    monkeypatch.setattr(
+        "brightcove_async.initialise.BrightcoveOAuthCreds", MockOAuthCreds
+    )
+    monkeypatch.setattr(
+        "brightcove_async.initialise.build_service_registry", mock_registry
+    )
+    return MockOAuthCreds, mock_registry
 
 
-def test_initialise_brightcove_client_with_custom_config():
-    """Test initialise_brightcove_client with custom API configuration."""
-    with patch("brightcove_async.initialise.BrightcoveOAuthCreds") as MockOAuthCreds:
-        mock_creds = MagicMock()
-        mock_creds.client_id = "test_id"
-        mock_creds.client_secret = MagicMock()
-        mock_creds.client_secret.get_secret_value.return_value = "test_secret"
-        MockOAuthCreds.return_value = mock_creds
+@pytest.mark.parametrize(
+    "override",
+    [{}, {"oauth_creds": CUSTOM_CREDS}, {"client_config": CUSTOM_CONFIG}],
+    ids=["defaults", "custom_creds", "custom_config"],
+)
+def test_initialise_brightcove_client(override, default_mock_creds, patched_factories):
+    """Test initialise_brightcove_client with default and overridden arguments."""
+    MockOAuthCreds, mock_registry = patched_factories
 
-        custom_config = BrightcoveBaseAPIConfig(
-            cms_base_url="https://custom-cms.example.com/",
-            syndication_base_url="https://custom-syndication.example.com/",
-        )
+    client = initialise_brightcove_client(**override)
 
-        with patch(
-            "brightcove_async.initialise.build_service_registry",
-        ) as mock_registry:
-            mock_registry.return_value = {}
+    assert isinstance(client, BrightcoveClient)
+    assert client._oauth_cls is OAuthClient
 
-            client = initialise_brightcove_client(client_config=custom_config)
+    creds = override.get("oauth_creds", default_mock_creds)
+    assert client._client_id == creds.client_id
+    assert client._client_secret == creds.client_secret.get_secret_value()
+    assert MockOAuthCreds.call_count == (0 if "oauth_creds" in override else 1)
 
-            assert isinstance(client, BrightcoveClient)
-            mock_registry.assert_called_once_with(custom_config)
+    mock_registry.assert_called_once()
+    config = mock_registry.call_args.args[0]
+    if "client_config" in override:
+        assert config is override["client_config"]
+    else:
+        assert isinstance(config, BrightcoveBaseAPIConfig)
 
 
-def test_initialise_brightcove_client_uses_oauth_client():
-    """Test that initialise_brightcove_client uses OAuthClient class."""
-    with (
-        patch("brightcove_async.initialise.BrightcoveOAuthCreds") as MockOAuthCreds,
-        patch("brightcove_async.initialise.build_service_registry") as mock_registry,
-    ):
-        mock_creds = MagicMock()
-        mock_creds.client_id = "test_id"
-        mock_creds.client_secret = MagicMock()
-        mock_creds.client_secret.get_secret_value.return_value = "test_secret"
-        MockOAuthCreds.return_value = mock_creds
-
-        mock_registry.return_value = {}
+def test_initialise_brightcove_client_builds_service_registry(
+    monkeypatch, patched_factories
+):
+    """Test that initialise_brightcove_client builds service registry."""
+    _, mock_registry = patched_factories
 
-        client = initialise_brightcove_client()
+    mock_config = MagicMock()
+    monkeypatch.setattr(
+        "brightcove_async.initialise.BrightcoveBaseAPIConfig",
+        MagicMock(return_value=mock_config),
+    )
 
-        assert client._oauth_cls == OAuthClient
+    mock_service_config = MagicMock()
+    mock_registry.return_value = {"cms": mock_service_config}
 
+    client = initialise_brightcove_client()
 
-def test_initialise_brightcove_client_builds_service_registry():
-    """Test that initialise_brightcove_client builds service registry."""
-    with (
-        patch("brightcove_async.initialise.BrightcoveOAuthCreds") as MockOAuthCreds,
-        patch("brightcove_async.initialise.BrightcoveBaseAPIConfig") as MockAPIConfig,
-        patch("brightcove_async.initialise.build_service_registry") as mock_registry,
-    ):
-        mock_creds = MagicMock()
-        mock_creds.client_id = "test_id"
-        mock_creds.client_secret = MagicMock()
-        mock_creds.client_secret.get_secret_value.return_value = "test_secret"
-        MockOAuthCreds.return_value = mock_creds
-
-        mock_config = MagicMock()
-        MockAPIConfig.return_value = mock_config
-
-        mock_service_config = MagicMock()
-        mock_registry.return_value = {"cms": mock_service_config}
-
-        client = initialise_brightcove_client()
-
-        mock_registry.assert_called_once_with(mock_config)
-        assert "cms" in client._service_classes
-        assert client._service_classes["cms"] is mock_service_config
+    mock_registry.assert_called_once_with(mock_config)
+    assert "cms" in client._service_classes
+    assert client._service_classes["cms"] is mock_service_config
@@ -1,17 +1,35 @@
-import time
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import aiohttp
 import pytest
+from _fake_session import FakeResponseContext, FakeSession
 from aiohttp import BasicAuth
 
+from brightcove_async.oauth import oauth
 from brightcove_async.oauth.oauth import OAuthClient
 
+FROZEN_NOW = 1_700_000_000.0
+
 
 @pytest.fixture
 def mock_session():
-    """Create a mock aiohttp.ClientSession."""
-    return AsyncMock(spec=aiohttp.ClientSession)
+    """Create a fake aiohttp.ClientSession exposing only `post`."""
+    return FakeSession()
+
+
+@pytest.fixture
+def frozen_time(monkeypatch):
+    """Freeze the clock seen by the OAuth module at FROZEN_NOW."""
+    monkeypatch.setattr(oauth, "time", SimpleNamespace(monotonic=lambda: FROZEN_NOW))
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Replace the retry backoff sleep with an immediate AsyncMock."""
+    mock_sleep = AsyncMock()
+    monkeypatch.setattr(oauth.asyncio, "sleep", mock_sleep)
+    return mock_sleep
 
 
 @pytest.fixture
@@ -24,7 +42,6 @@ def oauth_client(mock_session):
     )
 
 
-@pytest.mark.asyncio
 async def test_oauth_initialization(oauth_client):
     """Test OAuthClient initializes with correct attributes."""
     assert oauth_client.client_id == "test_client_id"
@@ -34,32 +51,35 @@ async def test_oauth_initialization(oauth_client):
     assert oauth_client._token_life == 240.0
 
 
-@pytest.mark.asyncio
-async def test_get_access_token_first_request(oauth_client, mock_session):
+async def test_get_access_token_first_request(oauth_client, mock_session, frozen_time):
     """Test fetching access token for the first time."""
     mock_response = AsyncMock()
     mock_response.json = AsyncMock(return_value={"access_token": "new_token_123"})
     mock_response.raise_for_status = MagicMock()
 
-    mock_session.post.return_value.__aenter__.return_value = mock_response
+    mock_session.post.return_value = FakeResponseContext(mock_response)
 
     token = await oauth_client.get_access_token()
 
     assert token == "new_token_123"
     assert oauth_client._access_token == "new_token_123"
-    assert oauth_client._request_time > 0
+    assert oauth_client._request_time == FROZEN_NOW
 
     mock_session.post.assert_called_once()
     call_kwargs = mock_session.post.call_args.kwargs
     assert call_kwargs["url"] == "https://oauth.brightcove.com/v4/access_token"
     assert isinstance(call_kwargs["auth"], BasicAuth)
+    assert call_kwargs["auth"] is oauth_client._auth
+    assert call_kwargs["headers"] == {
+        "Content-Type": "application/x-www-form-urlencoded"
+    }
+    assert call_kwargs["data"] == b"grant_type=client_credentials"
 
 
-@pytest.mark.asyncio
-async def test_get_access_token_uses_cached_token(oauth_client):
+async def test_get_access_token_uses_cached_token(oauth_client, frozen_time):
     """Test that cached token is used when still valid."""
     oauth_client._access_token = "cached_token"
-    oauth_client._request_time = time.time()
+    oauth_client._request_time = FROZEN_NOW
 
     token = await oauth_client.get_access_token()
 
@@ -67,17 +87,18 @@ async def test_get_access_token_uses_cached_token(oauth_client):
     oauth_client._session.post.assert_not_called()
 
 
-@pytest.mark.asyncio
-async def test_get_access_token_refreshes_expired_token(oauth_client, mock_session):
+async def test_get_access_token_refreshes_expired_token(
+    oauth_client, mock_session, frozen_time
+):
     """Test that expired token is refreshed."""
     oauth_client._access_token = "old_token"
-    oauth_client._request_time = time.time() - 300  # 5 minutes ago
+    oauth_client._request_time = FROZEN_NOW - 300  # 5 minutes ago
 
     mock_response = AsyncMock()
     mock_response.json = AsyncMock(return_value={"access_token": "refreshed_token"})
     mock_response.raise_for_status = MagicMock()
 
-    mock_session.post.return_value.__aenter__.return_value = mock_response
+    mock_session.post.return_value = FakeResponseContext(mock_response)
 
     token = await oauth_client.get_access_token()
 
@@ -86,27 +107,47 @@ async def test_get_access_token_refreshes_expired_token(oauth_client, mock_sessi
     mock_session.post.assert_called_once()
 
 
-@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("token_age", "expect_refresh"),
+    [(239.0, False), (240.0, False), (241.0, True)],
+)
+async def test_token_expiry_boundary(
+    oauth_client, mock_session, frozen_time, token_age, expect_refresh
+):
+    """Test that the token is reused up to and including its lifetime."""
+    oauth_client._access_token = "cached_token"
+    oauth_client._request_time = FROZEN_NOW - token_age
+
+    mock_response = AsyncMock()
+    mock_response.json = AsyncMock(return_value={"access_token": "refreshed_token"})
+    mock_response.raise_for_status = MagicMock()
+    mock_session.post.return_value = FakeResponseContext(mock_response)
+
+    token = await oauth_client.get_access_token()
+
+    assert token == ("refreshed_token" if expect_refresh else "cached_token")
+    assert mock_session.post.call_count == int(expect_refresh)
+
+
 async def test_get_access_token_raises_on_failure(oauth_client, mock_session):
     """Test that ValueError is raised when token fetch returns no token."""
     mock_response = AsyncMock()
     mock_response.json = AsyncMock(return_value={})  # No access_token
     mock_response.raise_for_status = MagicMock()
 
-    mock_session.post.return_value.__aenter__.return_value = mock_response
+    mock_session.post.return_value = FakeResponseContext(mock_response)
 
     with pytest.raises(ValueError, match="access_token"):
         await oauth_client.get_access_token()
 
 
-@pytest.mark.asyncio
 async def test_headers_property(oauth_client, mock_session):
     """Test headers property returns correctly formatted headers."""
     mock_response = AsyncMock()
     mock_response.json = AsyncMock(return_value={"access_token": "test_token"})
     mock_response.raise_for_status = MagicMock()
 
-    mock_session.post.return_value.__aenter__.return_value = mock_response
+    mock_session.post.return_value = FakeResponseContext(mock_response)
 
     headers = await oauth_client.headers
 
@@ -116,50 +157,66 @@ async def test_headers_property(oauth_client, mock_session):
     }
 
 
-@pytest.mark.asyncio
-async def test_retry_on_connection_error(oauth_client, mock_session):
+async def test_retry_on_connection_error(oauth_client, mock_session, no_sleep):
     """Test that connection errors are retried."""
     mock_response = AsyncMock()
     mock_response.json = AsyncMock(return_value={"access_token": "retry_token"})
     mock_response.raise_for_status = MagicMock()
 
     # First call fails, second succeeds
-    mock_session.post.return_value.__aenter__.side_effect = [
-        aiohttp.ClientConnectionError("Connection failed"),
-        mock_response,
+    mock_session.post.side_effect = [
+        FakeResponseContext(aiohttp.ClientConnectionError("Connection failed")),
+        FakeResponseContext(mock_response),
     ]
 
     token = await oauth_client.get_access_token()
 
     assert token == "retry_token"
     assert mock_session.post.call_count == 2
+    no_sleep.assert_awaited_once()
+    (delay,) = no_sleep.await_args.args
+    assert 1.0 <= delay <= 1.5
+
+
+async def test_retry_gives_up_after_max_attempts(oauth_client, mock_session, no_sleep):
+    """Test that the last connection error is re-raised once retries run out."""
+    mock_session.post.side_effect = [
+        FakeResponseContext(aiohttp.ClientConnectionError("Connection failed"))
+        for _ in range(3)
+    ]
+
+    with pytest.raises(aiohttp.ClientConnectionError):
+        await oauth_client.get_access_token()
+
+    assert mock_session.post.call_count == 3
+    assert no_sleep.await_count == 2
 
 
-@pytest.mark.asyncio
 async def test_http_error_response(oauth_client, mock_session):
     """Test that a 200 response with no access_token raises ValueError."""
     mock_response = AsyncMock()
     mock_response.json = AsyncMock(return_value={"error": "invalid"})
     mock_response.raise_for_status = MagicMock()  # Don't raise, just return empty
 
-    mock_session.post.return_value.__aenter__.return_value = mock_response
+    mock_session.post.return_value = FakeResponseContext(mock_response)
 
     with pytest.raises(ValueError, match="access_token"):
         await oauth_client.get_access_token()
 
 
-@pytest.mark.asyncio
-async def test_concurrent_token_refresh_only_fetches_once(oauth_client, mock_session):
+async def test_concurrent_token_refresh_only_fetches_once(
+    oauth_client, mock_session, frozen_time
+):
     """Concurrent callers with an expired token should only trigger one refresh."""
     import asyncio
 
     oauth_client._access_token = "old_token"
-    oauth_client._request_time = time.time() - 300  # expired
+    oauth_client._request_time = FROZEN_NOW - 300  # expired
 
     mock_response = AsyncMock()
     mock_response.json = AsyncMock(return_value={"access_token": "new_token"})
     mock_response.raise_for_status = MagicMock()
-    mock_session.post.return_value.__aenter__.return_value = mock_response
+    mock_session.post.return_value = FakeResponseContext(mock_response)
 
     # Run two concurrent token fetches
     results = await asyncio.gather(
@@ -0,0 +1,107 @@
+"""Tests for query parameter models."""
+
+import pytest
+
+from brightcove_async.schemas.params import (
+    GetAnalyticsReportParams,
+    GetLivestreamAnalyticsParams,
+    GetVideoCountParams,
+    GetVideosQueryParams,
+    ParamsBase,
+)
+
+
+class _ParamsAB(ParamsBase):
+    a: str | None = None
+    b: int | None = None
+
+
+class _ParamsXY(ParamsBase):
+    x: str | None = None
+    y: int | None = None
+
+
+class _ParamsA(ParamsBase):
+    a: str | None = None
+
+
+class TestParamsBase:
+    def test_serialize_params_excludes_none(self):
+        params = _ParamsAB(a="value")
+        assert params.serialize_params() == {"a": "value"}
+
+    def test_serialize_params_with_all_values(self):
+        params = _ParamsXY(x="value", y=5)
+        assert params.serialize_params() == {"x": "value", "y": 5}
+
+    def test_serialize_params_empty(self):
+        params = _ParamsA()
+        assert params.serialize_params() == {}
+
+
+PARAM_CASES = [
+    (GetVideosQueryParams, {}, {"limit": 10, "offset": 20, "q": "tags:nature"}),
+    (GetVideoCountParams, {}, {"q": "state:ACTIVE"}),
+    (
+        GetAnalyticsReportParams,
+        {"accounts": "acc123", "dimensions": "video"},
+        {"limit": 5, "reconciled": True},
+    ),
+    (
+        GetLivestreamAnalyticsParams,
+        {"dimensions": "video", "metrics": "video_view", "where": "video==vid1"},
+        {"bucket_limit": 5, "bucket_duration": "1h"},
+    ),
+]
+PARAM_CASE_IDS = [case[0].__name__ for case in PARAM_CASES]
+
+
+@pytest.mark.parametrize(
+    ("model", "required", "optional"), PARAM_CASES, ids=PARAM_CASE_IDS
+)
+def test_optional_fields_default_to_none(model, required, optional):
+    params = model(**required)
+    for field in optional:
+        assert getattr(params, field) is None
+
+
+@pytest.mark.parametrize(
+    ("model", "required", "optional"), PARAM_CASES, ids=PARAM_CASE_IDS
+)
+def test_serialize_params_with_values(model, required, optional):
+    params = model(**required, **optional)
+    assert params.serialize_params() == {**required, **optional}
+
+
+@pytest.mark.parametrize(
+    ("model", "required", "optional"), PARAM_CASES, ids=PARAM_CASE_IDS
+)
+def test_serialize_params_excludes_unset(model, required, optional):
+    params = model(**required)
+    assert params.serialize_params() == required
+
+
+def test_analytics_report_params_serializes_aliases():
+    params = GetAnalyticsReportParams(
+        accounts="acc123",
+        dimensions="video",
+        from_="2024-01-01",
+        format_="csv",
+    )
+    serialized = params.serialize_params()
+    assert serialized["from"] == "2024-01-01"
+    assert serialized["format"] == "csv"
+    assert "from_" not in serialized
+    assert "format_" not in serialized
+
+
+def test_livestream_analytics_params_serializes_from_alias():
+    params = GetLivestreamAnalyticsParams(
+        dimensions="video",
+        metrics="video_view",
+        where="video==vid1",
+        from_="-1d",
+    )
+    serialized = params.serialize_params()
+    assert serialized["from"] == "-1d"
+    assert "from_" not in serialized
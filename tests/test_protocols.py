@@ -0,0 +1,44 @@
+"""Tests for runtime protocol conformance."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from brightcove_async.oauth.oauth import OAuthClient
+from brightcove_async.protocols import OAuthClientProtocol
+
+_SHARED_SESSION = AsyncMock()
+
+
+class _FakeOAuth:
+    def __init__(self, client_id, client_secret, session):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.session = session
+
+    async def get_access_token(self):
+        return "token"
+
+    def invalidate_token(self):
+        pass
+
+    @property
+    async def headers(self):
+        return {"Authorization": "Bearer token"}
+
+
+class _NotOAuth:
+    pass
+
+
+@pytest.mark.parametrize(
+    ("obj", "expected"),
+    [
+        (OAuthClient("id", "secret", _SHARED_SESSION), True),
+        (_FakeOAuth("id", "secret", None), True),
+        (_NotOAuth(), False),
+    ],
+    ids=["oauth_client", "conforming", "non_conforming"],
+)
+def test_oauth_client_protocol_isinstance(obj, expected):
+    assert isinstance(obj, OAuthClientProtocol) is expected
@@ -1,11 +1,27 @@
+import pytest
+
 from brightcove_async.registry import ServiceConfig, build_service_registry
 from brightcove_async.services.analytics import Analytics
+from brightcove_async.services.audience import Audience
 from brightcove_async.services.cms import CMS
 from brightcove_async.services.dynamic_ingest import DynamicIngest
+from brightcove_async.services.ingest_profiles import IngestProfiles
 from brightcove_async.services.syndication import Syndication
 from brightcove_async.settings import BrightcoveBaseAPIConfig
 
 
+@pytest.fixture(scope="module")
+def config():
+    """Default API configuration, built once for the module."""
+    return BrightcoveBaseAPIConfig()
+
+
+@pytest.fixture(scope="module")
+def registry(config):
+    """Service registry built from the default configuration."""
+    return build_service_registry(config)
+
+
 def test_service_config_creation():
     """Test ServiceConfig dataclass creation."""
     config = ServiceConfig(
@@ -14,7 +30,7 @@ def test_service_config_creation():
         requests_per_second=4,
     )
 
-    assert config.cls == CMS
+    assert config.cls is CMS
     assert config.base_url == "https://cms.api.brightcove.com/v1/accounts/"
     assert config.requests_per_second == 4
 
@@ -29,64 +45,36 @@ def test_service_config_defaults():
     assert config.requests_per_second == 10
 
 
-def test_build_service_registry():
-    """Test build_service_registry creates correct registry."""
-    config = BrightcoveBaseAPIConfig()
-
-    registry = build_service_registry(config)
-
-    assert "cms" in registry
-    assert "syndication" in registry
-    assert "analytics" in registry
-    assert "dynamic_ingest" in registry
-
-
-def test_build_service_registry_cms_config():
-    """Test CMS service configuration in registry."""
-    config = BrightcoveBaseAPIConfig()
-    registry = build_service_registry(config)
-
-    cms_config = registry["cms"]
-
-    assert cms_config.cls == CMS
-    assert cms_config.base_url == config.cms_base_url
-    assert cms_config.requests_per_second == 4
-
-
-def test_build_service_registry_syndication_config():
-    """Test Syndication service configuration in registry."""
-    config = BrightcoveBaseAPIConfig()
-    registry = build_service_registry(config)
-
-    syndication_config = registry["syndication"]
-
-    assert syndication_config.cls == Syndication
-    assert syndication_config.base_url == config.syndication_base_url
-    assert syndication_config.requests_per_second == 10
-
-
-def test_build_service_registry_analytics_config():
-    """Test Analytics service configuration in registry."""
-    config = BrightcoveBaseAPIConfig()
-    registry = build_service_registry(config)
-
-    analytics_config = registry["analytics"]
-
-    assert analytics_config.cls == Analytics
-    assert analytics_config.base_url == config.analytics_base_url
-    assert analytics_config.requests_per_second == 10
-
+def test_registry_exact_keys(registry):
+    """Test build_service_registry registers exactly the known services."""
+    assert registry.keys() == {
+        "cms",
+        "syndication",
+        "analytics",
+        "dynamic_ingest",
+        "ingest_profiles",
+        "audience",
+    }
 
-def test_build_service_registry_dynamic_ingest_config():
-    """Test DynamicIngest service configuration in registry."""
-    config = BrightcoveBaseAPIConfig()
-    registry = build_service_registry(config)
 
-    di_config = registry["dynamic_ingest"]
+@pytest.mark.parametrize(
+    ("key", "cls", "url_attr", "rps"),
+    [
+        ("cms", CMS, "cms_base_url", 4),
+        ("syndication", Syndication, "syndication_base_url", 10),
+        ("analytics", Analytics, "analytics_base_url", 10),
+        ("dynamic_ingest", DynamicIngest, "dynamic_ingest_base_url", 10),
+        ("ingest_profiles", IngestProfiles, "ingest_profiles_base_url", 4),
+        ("audience", Audience, "audience_base_url", 10),
+    ],
+)
+def test_registry_entry(config, registry, key, cls, url_attr, rps):
+    """Test each service's class, base URL and rate limit in the registry."""
+    service_config = registry[key]
 
-    assert di_config.cls == DynamicIngest
-    assert di_config.base_url == config.dynamic_ingest_base_url
-    assert di_config.requests_per_second == 10
+    assert service_config.cls is cls
+    assert service_config.base_url == getattr(config, url_attr)
+    assert service_config.requests_per_second == rps
 
 
 def test_build_service_registry_custom_urls():
@@ -108,19 +96,3 @@ def test_build_service_registry_custom_urls():
     assert (
         registry["ingest_profiles"].base_url == "https://custom-profiles.example.com/"
     )
-
-
-def test_service_registry_returns_dict():
-    """Test that build_service_registry returns a dictionary."""
-    config = BrightcoveBaseAPIConfig()
-    registry = build_service_registry(config)
-
-    assert isinstance(registry, dict)
-    assert set(registry.keys()) == {
-        "cms",
-        "syndication",
-        "analytics",
-        "dynamic_ingest",
-        "ingest_profiles",
-        "audience",
-    }
@@ -1,11 +1,10 @@
 """Tests for schema models validation and serialization."""
 
-from json import loads
 from pathlib import Path
 from typing import Sized
 
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from brightcove_async.schemas.analytics_model import (
     Dimensions,
@@ -53,556 +52,522 @@ from brightcove_async.schemas.syndication_model import (
     Type,
 )
 
-# --- Fixtures ---
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+_MOCK_DIR = Path(__file__).parent / "mock_responses"
+_HAVE_MOCKS = _MOCK_DIR.is_dir()
+
+
+def _mock_bytes(name: str) -> bytes:
+    """Read a raw mock API response; decodes to None when mocks are absent."""
+    return (_MOCK_DIR / name).read_bytes() if _HAVE_MOCKS else b"null"
+
+
+# Mock API responses, loaded once at import.
+MOCK_VIDEO_BYTES = _mock_bytes("get_videos_response.json")
+MOCK_VIDEO = loads(MOCK_VIDEO_BYTES)
+MOCK_CREATE_VIDEO_BYTES = _mock_bytes("create_video_response.json")
+MOCK_CREATE_VIDEO = loads(MOCK_CREATE_VIDEO_BYTES)
+MOCK_VIDEO_COUNT_BYTES = _mock_bytes("get_video_count_response.json")
+MOCK_VIDEO_COUNT = loads(MOCK_VIDEO_COUNT_BYTES)
+MOCK_VIDEO_SOURCES_BYTES = _mock_bytes("get_video_sources_response.json")
+MOCK_VIDEO_SOURCES = loads(MOCK_VIDEO_SOURCES_BYTES)
+MOCK_VIDEO_VARIANTS_BYTES = _mock_bytes("get_all_video_variants_response.json")
+MOCK_VIDEO_VARIANTS = loads(MOCK_VIDEO_VARIANTS_BYTES)
+MOCK_VIDEO_IMAGES_BYTES = _mock_bytes("get_video_images.json")
+MOCK_VIDEO_IMAGES = loads(MOCK_VIDEO_IMAGES_BYTES)
+MOCK_CREATE_VIDEO_VARIANT_BYTES = _mock_bytes("create_video_variant.json")
+MOCK_CREATE_VIDEO_VARIANT = loads(MOCK_CREATE_VIDEO_VARIANT_BYTES)
+MOCK_AUDIO_TRACKS_BYTES = _mock_bytes("get_video_audio_tracks_response.json")
+MOCK_AUDIO_TRACKS = loads(MOCK_AUDIO_TRACKS_BYTES)
+MOCK_DIGITAL_MASTER_BYTES = _mock_bytes("get_digital_master_response.json")
+MOCK_DIGITAL_MASTER = loads(MOCK_DIGITAL_MASTER_BYTES)
+MOCK_PLAYLISTS_BYTES = _mock_bytes("get_playlists_for_video_response.json")
+MOCK_PLAYLISTS = loads(MOCK_PLAYLISTS_BYTES)
+
+# Validators for the response-model tests, built once at import.
+_VIDEO_TA = TypeAdapter(Video)
+_VIDEO_ARRAY_TA = TypeAdapter(VideoArray)
+_VIDEO_COUNT_TA = TypeAdapter(VideoCount)
+_VIDEO_SRC_TA = TypeAdapter(VideoSourcesList)
+_VIDEO_VARIANTS_TA = TypeAdapter(VideoVariants)
+_IMAGE_LIST_TA = TypeAdapter(ImageList)
+_AUDIO_TA = TypeAdapter(AudioTracks)
+_VARIANT_TA = TypeAdapter(VideoVariant)
+_DIGITAL_MASTER_TA = TypeAdapter(CMSDigitalMaster)
+_PLAYLIST_REFS_TA = TypeAdapter(PlaylistReferences)
 
+# --- Analytics Models ---
 
-@pytest.fixture
-def mock_video_response():
-    """Fixture to load a mock get videos API response."""
-    return loads(
-        Path("tests/mock_responses/get_videos_response.json").read_text(),
-    )
 
+@pytest.mark.parametrize(
+    ("cls", "kwargs", "checks"),
+    [
+        (Summary, {}, {"ad_mode_begin": None, "video_view": None}),
+        (
+            Summary,
+            {"video_view": 1000, "play_request": 500},
+            {"video_view": 1000, "play_request": 500},
+        ),
+        (
+            TimeSeries,
+            {"type": "flat", "values": [0.1, 0.5, 0.9]},
+            {"type": "flat", "values": [0.1, 0.5, 0.9]},
+        ),
+        (TimeSeries, {"type": "empty", "values": []}, {"values": []}),
+        (
+            GetAvailableDateRangeResponse,
+            {"reconciled_from": "2024-01-01", "reconciled_to": "2024-12-31"},
+            {"reconciled_from": "2024-01-01"},
+        ),
+        (
+            GetAlltimeVideoViewsResponse,
+            {"alltime_video_views": 5000},
+            {"alltime_video_views": 5000},
+        ),
+    ],
+    ids=[
+        "summary_defaults",
+        "summary_values",
+        "time_series",
+        "time_series_empty",
+        "available_date_range",
+        "alltime_video_views",
+    ],
+)
+def test_model_smoke(cls, kwargs, checks):
+    model = cls(**kwargs)
+    for attr, expected in checks.items():
+        assert getattr(model, attr) == expected
 
-@pytest.fixture
-def mock_create_video_response():
-    """Fixture to load a mock create video API response."""
-    return loads(
-        Path("tests/mock_responses/create_video_response.json").read_text(),
-    )
 
+def test_timeline_valid():
+    ts = TimeSeries.model_construct(type="flat", values=[0.1])
+    tl = Timeline(timeline=ts)
+    assert tl.timeline.type == "flat"
 
-@pytest.fixture
-def mock_video_count_response():
-    """Fixture to load a mock get video count API response."""
-    return loads(
-        Path("tests/mock_responses/get_video_count_response.json").read_text(),
+
+def test_get_analytics_report_response_valid():
+    resp = GetAnalyticsReportResponse(
+        item_count=1,
+        items=[Items.model_construct(video="vid1", video_view=100)],
+        summary=Summary.model_construct(),
     )
+    assert resp.item_count == 1
+    assert len(resp.items) == 1
+    assert resp.items[0].video == "vid1"
 
 
-@pytest.fixture
-def mock_video_sources_response():
-    """Fixture to load a mock get video sources API response."""
-    return loads(
-        Path("tests/mock_responses/get_video_sources_response.json").read_text(),
+def test_get_analytics_report_response_empty_items():
+    resp = GetAnalyticsReportResponse(
+        item_count=0,
+        items=[],
+        summary=Summary.model_construct(),
     )
+    assert resp.item_count == 0
+    assert resp.items == []
+
+
+@pytest.mark.parametrize(
+    ("member", "value"),
+    [
+        (Dimensions.video, "video"),
+        (Dimensions.country, "country"),
+        (Dimensions.date, "date"),
+        (Format.csv, "csv"),
+        (Format.json, "json"),
+        (Where.video, "video"),
+        (Where.device_type, "device_type"),
+        (PlaylistType.EXPLICIT, "EXPLICIT"),
+        (PlaylistType.ALPHABETICAL, "ALPHABETICAL"),
+        (Economics.AD_SUPPORTED, "AD_SUPPORTED"),
+        (Economics.FREE, "FREE"),
+        (State.ACTIVE, "ACTIVE"),
+        (State.INACTIVE, "INACTIVE"),
+    ],
+)
+def test_enum_value(member, value):
+    assert member == value
 
 
-@pytest.fixture
-def mock_video_variants_response():
-    """Fixture to load a mock get video variants API response."""
-    return loads(
-        Path("tests/mock_responses/get_all_video_variants_response.json").read_text(),
-    )
+@pytest.mark.parametrize(
+    ("member", "value"),
+    [
+        (Type.google, "google"),
+        (Type.universal, "universal"),
+        (Type.roku, "roku"),
+    ],
+)
+def test_syndication_type_value(member, value):
+    # Type is a plain Enum, so it only matches its string through .value.
+    assert member.value == value
 
 
-@pytest.fixture
-def mock_video_images_response():
-    """Fixture to load a mock get videos API response with images."""
-    return loads(
-        Path("tests/mock_responses/get_video_images.json").read_text(),
-    )
+# --- Syndication Models ---
 
 
-@pytest.fixture
-def mock_create_video_variant_response():
-    """Fixture to load a mock create video variant API response."""
-    return loads(
-        Path("tests/mock_responses/create_video_variant.json").read_text(),
-    )
+def test_syndication_minimal():
+    s = Syndication(name="Test Feed", type=Type.google)
+    assert s.name == "Test Feed"
+    assert s.type == Type.google
+    assert s.id is None
 
 
-@pytest.fixture
-def mock_get_audio_tracks_response():
-    """Fixture to load a mock get video audio tracks API response."""
-    return loads(
-        Path("tests/mock_responses/get_video_audio_tracks_response.json").read_text(),
+def test_syndication_full():
+    s = Syndication(
+        id="syn123",
+        name="Full Feed",
+        type=Type.universal,
+        include_all_content=True,
+        title="My Feed Title",
+        description="A test feed",
+        language="en",
+        explicit=Explicit.no,
     )
+    assert s.id == "syn123"
+    assert s.include_all_content is True
+    assert s.explicit == Explicit.no
 
 
-@pytest.fixture
-def mock_get_digital_master_response():
-    """Fixture to load a mock get digital master API response."""
-    return loads(
-        Path("tests/mock_responses/get_digital_master_response.json").read_text(),
-    )
+def test_syndication_list_empty_list():
+    sl = SyndicationList(root=[])
+    assert sl.root == []
 
 
-@pytest.fixture
-def mock_get_playlists_response():
-    """Fixture to load a mock get playlists API response."""
-    return loads(
-        Path("tests/mock_responses/get_playlists_for_video_response.json").read_text(),
+def test_syndication_list_with_items():
+    sl = SyndicationList(
+        root=[
+            Syndication(name="Feed1", type=Type.google),
+            Syndication(name="Feed2", type=Type.mp4),
+        ],
     )
+    assert len(sl.root) == 2
 
 
-# --- Analytics Models ---
-
+# --- Ingest Profiles Models ---
 
-class TestSummary:
-    def test_all_optional_fields(self):
-        summary = Summary()
-        assert summary.ad_mode_begin is None
-        assert summary.video_view is None
 
-    def test_with_values(self):
-        summary = Summary(video_view=1000, play_request=500)
-        assert summary.video_view == 1000
-        assert summary.play_request == 500
+def test_ingest_profile_valid():
+    profile = IngestProfile(
+        version=1,
+        name="test-profile",
+        display_name="Test Profile",
+        description="A test profile",
+        account_id=12345,
+        brightcove_standard=True,
+        date_created=1700000000,
+        date_last_modified=1700000001,
+        digital_master=DigitalMaster.model_construct(
+            rendition="passthrough", distribute=True
+        ),
+        id="prof123",
+    )
+    assert profile.name == "test-profile"
+    assert profile.digital_master is not None
+    assert profile.digital_master.distribute is True
+    assert profile.renditions == []
+    assert profile.packages == []
+    assert profile.dynamic_origin is None
+
+
+def test_ingest_profile_with_dynamic_origin():
+    profile = IngestProfile(
+        version=2,
+        name="dynamic-profile",
+        display_name="Dynamic",
+        description="Profile with dynamic origin",
+        account_id=12345,
+        brightcove_standard=False,
+        date_created=1700000000,
+        date_last_modified=1700000001,
+        digital_master=DigitalMaster.model_construct(
+            rendition="passthrough", distribute=False
+        ),
+        dynamic_origin=DynamicOrigin.model_construct(
+            renditions=["rendition1"],
+            images=[
+                DynamicOriginImage.model_construct(
+                    label="poster", height=720, width=1280
+                )
+            ],
+        ),
+        id="prof456",
+    )
+    assert profile.dynamic_origin is not None
+    assert len(profile.dynamic_origin.images) == 1
 
 
-class TestTimeSeries:
-    def test_valid_time_series(self):
-        ts = TimeSeries(type="flat", values=[0.1, 0.5, 0.9])
-        assert ts.type == "flat"
-        assert len(ts.values) == 3
+# --- CMS Models ---
 
-    def test_empty_values(self):
-        ts = TimeSeries(type="empty", values=[])
-        assert ts.values == []
 
-    def test_missing_required_fields(self):
-        with pytest.raises(ValidationError):
-            TimeSeries()
+def test_video_array_empty_array():
+    va = VideoArray(root=[])
+    assert va.root == []
 
 
-class TestTimeline:
-    def test_valid_timeline(self):
-        ts = TimeSeries(type="flat", values=[0.1])
-        tl = Timeline(timeline=ts)
-        assert tl.timeline.type == "flat"
+@pytest.mark.parametrize(
+    ("payload", "expected_len"),
+    [
+        ({"name": "Test Video", "id": "vid1"}, 1),
+        ([{"name": "Test Video", "id": "vid1"}], 1),
+        ([{"name": "V1"}, {"name": "V2"}], 2),
+    ],
+    ids=["bare_dict", "single_item_list", "multiple"],
+)
+def test_video_array_ensure_list_validator(payload, expected_len):
+    """Test that a single video dict or a list always validates to a list root."""
+    assert len(_VIDEO_ARRAY_TA.validate_python(payload).root) == expected_len
 
 
-class TestGetAnalyticsReportResponse:
-    def test_valid_response(self):
-        resp = GetAnalyticsReportResponse(
-            item_count=1,
-            items=[Items(video="vid1", video_view=100)],
-            summary=Summary(),
-        )
-        assert resp.item_count == 1
-        assert len(resp.items) == 1
-        assert resp.items[0].video == "vid1"
+def test_video_count_with_count():
+    vc = VideoCount(count=42)
+    assert vc.count == 42
 
-    def test_empty_items(self):
-        resp = GetAnalyticsReportResponse(
-            item_count=0,
-            items=[],
-            summary=Summary(),
-        )
-        assert resp.item_count == 0
-        assert resp.items == []
 
+def test_video_count_with_none():
+    vc = VideoCount()
+    assert vc.count is None
 
-class TestGetAvailableDateRangeResponse:
-    def test_valid_response(self):
-        resp = GetAvailableDateRangeResponse(
-            reconciled_from="2024-01-01",
-            reconciled_to="2024-12-31",
-        )
-        assert resp.reconciled_from == "2024-01-01"
 
-    def test_missing_required(self):
-        with pytest.raises(ValidationError):
-            GetAvailableDateRangeResponse()
+def test_playlist_minimal():
+    p = Playlist()
+    assert p.id is None
+    assert p.name is None
 
 
-class TestGetAlltimeVideoViewsResponse:
-    def test_valid(self):
-        resp = GetAlltimeVideoViewsResponse(alltime_video_views=5000)
-        assert resp.alltime_video_views == 5000
+def test_video_minimal():
+    v = Video()
+    assert v.id is None
+    assert v.name is None
 
-    def test_missing_required(self):
-        with pytest.raises(ValidationError):
-            GetAlltimeVideoViewsResponse()
 
+def test_video_with_fields():
+    v = Video(
+        id="vid123",
+        name="My Video",
+        state=State3.ACTIVE,
+        economics=Economics.AD_SUPPORTED,
+    )
+    assert v.id == "vid123"
+    assert v.name == "My Video"
 
-class TestDimensions:
-    def test_dimension_values(self):
-        assert Dimensions.video == "video"
-        assert Dimensions.country == "country"
-        assert Dimensions.date == "date"
 
-    def test_format_values(self):
-        assert Format.csv == "csv"
-        assert Format.json == "json"
+# --- CMS Sub-Models ---
 
-    def test_where_values(self):
-        assert Where.video == "video"
-        assert Where.device_type == "device_type"
 
+def test_sources_valid():
+    s = Sources(src="https://example.com/image.jpg")
+    assert s.src == "https://example.com/image.jpg"
 
-# --- Syndication Models ---
 
+@pytest.mark.parametrize(
+    "model_cls",
+    [
+        TimeSeries,
+        GetAvailableDateRangeResponse,
+        GetAlltimeVideoViewsResponse,
+        Syndication,
+        Sources,
+    ],
+)
+def test_required_fields_raise(model_cls):
+    with pytest.raises(ValidationError) as exc_info:
+        model_cls()
+    assert {error["type"] for error in exc_info.value.errors()} == {"missing"}
 
-class TestSyndicationModel:
-    def test_minimal_syndication(self):
-        s = Syndication(name="Test Feed", type=Type.google)
-        assert s.name == "Test Feed"
-        assert s.type == Type.google
-        assert s.id is None
-
-    def test_full_syndication(self):
-        s = Syndication(
-            id="syn123",
-            name="Full Feed",
-            type=Type.universal,
-            include_all_content=True,
-            title="My Feed Title",
-            description="A test feed",
-            language="en",
-            explicit=Explicit.no,
-        )
-        assert s.id == "syn123"
-        assert s.include_all_content is True
-        assert s.explicit == Explicit.no
-
-    def test_missing_required_fields(self):
-        with pytest.raises(ValidationError):
-            Syndication()
-
-    def test_type_enum_values(self):
-        assert Type.google.value == "google"
-        assert Type.universal.value == "universal"
-        assert Type.roku.value == "roku"
-
-
-class TestSyndicationList:
-    def test_empty_list(self):
-        sl = SyndicationList(root=[])
-        assert sl.root == []
-
-    def test_with_items(self):
-        sl = SyndicationList(
-            root=[
-                Syndication(name="Feed1", type=Type.google),
-                Syndication(name="Feed2", type=Type.mp4),
-            ],
-        )
-        assert len(sl.root) == 2
 
+def test_custom_field_defaults():
+    cf = CustomField()
+    assert cf.description is None
+    assert cf.required is False
+    assert cf.type is None
 
-# --- Ingest Profiles Models ---
 
+def test_custom_field_with_values():
+    cf = CustomField(
+        id="genre",
+        display_name="Genre",
+        type="enum",
+        enum_values=["action", "comedy"],
+    )
+    assert cf.id == "genre"
+    assert cf.enum_values is not None
+    assert len(cf.enum_values) == 2
 
-class TestIngestProfile:
-    def test_valid_profile(self):
-        profile = IngestProfile(
-            version=1,
-            name="test-profile",
-            display_name="Test Profile",
-            description="A test profile",
-            account_id=12345,
-            brightcove_standard=True,
-            date_created=1700000000,
-            date_last_modified=1700000001,
-            digital_master=DigitalMaster(rendition="passthrough", distribute=True),
-            id="prof123",
-        )
-        assert profile.name == "test-profile"
-        assert profile.digital_master is not None
-        assert profile.digital_master.distribute is True
-        assert profile.renditions == []
-        assert profile.packages == []
-        assert profile.dynamic_origin is None
-
-    def test_with_dynamic_origin(self):
-        profile = IngestProfile(
-            version=2,
-            name="dynamic-profile",
-            display_name="Dynamic",
-            description="Profile with dynamic origin",
-            account_id=12345,
-            brightcove_standard=False,
-            date_created=1700000000,
-            date_last_modified=1700000001,
-            digital_master=DigitalMaster(rendition="passthrough", distribute=False),
-            dynamic_origin=DynamicOrigin(
-                renditions=["rendition1"],
-                images=[DynamicOriginImage(label="poster", height=720, width=1280)],
-            ),
-            id="prof456",
-        )
-        assert profile.dynamic_origin is not None
-        assert len(profile.dynamic_origin.images) == 1
 
+def test_standard_field_defaults():
+    sf = StandardField()
+    assert sf.id is None
+    assert sf.required is None
 
-# --- CMS Models ---
 
+def test_standard_field_with_values():
+    sf = StandardField(id="tags", description="Video tags")
+    assert sf.id == "tags"
 
-class TestVideoArray:
-    def test_empty_array(self):
-        va = VideoArray(root=[])
-        assert va.root == []
 
-    def test_ensure_list_validator_with_single_dict(self):
-        """Test that the field_validator wraps a single video dict in a list."""
-        va = VideoArray.model_validate([{"name": "Test Video", "id": "vid1"}])
-        assert len(va.root) == 1
+def _check_video_array(validated: VideoArray) -> None:
+    assert len(validated.root) == 1
+    src = MOCK_VIDEO[0]
+    video = validated.root[0]
+    assert isinstance(video, Video)
+    assert (video.id, video.description, video.duration) == (
+        src["id"],
+        src["description"],
+        src["duration"],
+    )
+    assert video.complete is True
+    assert video.economics is Economics.AD_SUPPORTED
+    assert video.images is not None
+    assert video.geo is not None
+    assert video.custom_fields is not None
 
-    def test_ensure_list_validator_with_list(self):
-        va = VideoArray.model_validate([{"name": "V1"}, {"name": "V2"}])
-        assert len(va.root) == 2
 
+def _check_create_video(validated: Video) -> None:
+    src = MOCK_CREATE_VIDEO
+    # API returns ID as int or str, model casts to str
+    assert (validated.id, validated.ad_keys) == (str(src["id"]), src["ad_keys"])
 
-class TestVideoCount:
-    def test_with_count(self):
-        vc = VideoCount(count=42)
-        assert vc.count == 42
 
-    def test_with_none(self):
-        vc = VideoCount()
-        assert vc.count is None
+def _check_video_count(validated: VideoCount) -> None:
+    assert validated.count == MOCK_VIDEO_COUNT["count"]
 
 
-class TestPlaylist:
-    def test_minimal_playlist(self):
-        p = Playlist()
-        assert p.id is None
-        assert p.name is None
+def _check_video_sources(validated: VideoSourcesList) -> None:
+    for got, expected in zip(validated.root, MOCK_VIDEO_SOURCES, strict=True):
+        assert got.src == expected["src"]
 
-    def test_playlist_type_enum(self):
-        assert PlaylistType.EXPLICIT == "EXPLICIT"
-        assert PlaylistType.ALPHABETICAL == "ALPHABETICAL"
 
+def _check_video_variants(validated: VideoVariants) -> None:
+    for got, expected in zip(validated.root, MOCK_VIDEO_VARIANTS, strict=True):
+        assert got.language == expected["language"]
 
-class TestEconomics:
-    def test_values(self):
-        assert Economics.AD_SUPPORTED == "AD_SUPPORTED"
-        assert Economics.FREE == "FREE"
 
+def _check_video_images(validated: ImageList) -> None:
+    thumbnail = validated.root["thumbnail"]
+    assert thumbnail is not None
+    assert thumbnail.src == MOCK_VIDEO_IMAGES["thumbnail"]["src"]
 
-class TestState:
-    def test_values(self):
-        assert State.ACTIVE == "ACTIVE"
-        assert State.INACTIVE == "INACTIVE"
 
+def _check_create_video_variant(validated: VideoVariant) -> None:
+    src = MOCK_CREATE_VIDEO_VARIANT
+    assert (
+        validated.language,
+        validated.name,
+        validated.description,
+        validated.long_description,
+        validated.custom_fields,
+    ) == (
+        src["language"],
+        src["name"],
+        src["description"],
+        src["long_description"],
+        src["custom_fields"],
+    )
 
-class TestVideo:
-    def test_minimal_video(self):
-        v = Video()
-        assert v.id is None
-        assert v.name is None
 
-    def test_video_with_fields(self):
-        v = Video(
-            id="vid123",
-            name="My Video",
-            state=State3.ACTIVE,
-            economics=Economics.AD_SUPPORTED,
-        )
-        assert v.id == "vid123"
-        assert v.name == "My Video"
+def _check_audio_tracks(validated: AudioTracks) -> None:
+    for got, expected in zip(validated.root, MOCK_AUDIO_TRACKS, strict=True):
+        assert got.language == expected["language"]
 
 
-# --- CMS Sub-Models ---
+def _check_digital_master(validated: CMSDigitalMaster) -> None:
+    src = MOCK_DIGITAL_MASTER
+    assert (validated.created_at, validated.updated_at, validated.encoding_rate) == (
+        src["created_at"],
+        src["updated_at"],
+        src["encoding_rate"],
+    )
 
 
-class TestSources:
-    def test_valid_source(self):
-        s = Sources(src="https://example.com/image.jpg")
-        assert s.src == "https://example.com/image.jpg"
-
-    def test_missing_required(self):
-        with pytest.raises(ValidationError):
-            Sources()
-
-
-class TestCustomField:
-    def test_defaults(self):
-        cf = CustomField()
-        assert cf.description is None
-        assert cf.required is False
-        assert cf.type is None
-
-    def test_with_values(self):
-        cf = CustomField(
-            id="genre",
-            display_name="Genre",
-            type="enum",
-            enum_values=["action", "comedy"],
-        )
-        assert cf.id == "genre"
-        assert cf.enum_values is not None
-        assert len(cf.enum_values) == 2
-
-
-class TestStandardField:
-    def test_defaults(self):
-        sf = StandardField()
-        assert sf.id is None
-        assert sf.required is None
-
-    def test_with_values(self):
-        sf = StandardField(id="tags", description="Video tags")
-        assert sf.id == "tags"
-
-
-class TestResponseModels:
-    def test_get_video_response_model(self, mock_video_response: list[dict]) -> None:
-        """Test that VideoArray correctly validates a real API response."""
-
-        validated_response = VideoArray.model_validate(mock_video_response)
-
-        assert isinstance(validated_response, VideoArray)
-        assert len(validated_response.root) == 1
-
-        video = validated_response.root[0]
-        assert isinstance(video, Video)
-        assert video.id == mock_video_response[0]["id"]
-        assert video.description == mock_video_response[0]["description"]
-        assert video.duration == mock_video_response[0]["duration"]
-        assert video.complete is True
-        assert video.economics == Economics.AD_SUPPORTED
-
-        assert video.images is not None
-        assert video.geo is not None
-        assert video.custom_fields is not None
-
-    def test_create_video_response_model(self, mock_create_video_response: dict):
-        """Test that Video model validates a create video response."""
-        validated_video = Video.model_validate(
-            mock_create_video_response,
-            strict=False,
-        )
-
-        assert isinstance(validated_video, Video)
-        assert validated_video.id == str(
-            mock_create_video_response["id"]
-        )  # API returns ID as int or str, model casts to str
-        assert validated_video.ad_keys == mock_create_video_response["ad_keys"]
-
-    def test_get_video_count_response_model(
-        self, mock_video_count_response: dict
-    ) -> None:
-        """Test that VideoCount model validates a get video count response."""
-        validated_count = VideoCount.model_validate(mock_video_count_response)
-
-        assert isinstance(validated_count, VideoCount)
-        assert validated_count.count == mock_video_count_response["count"]
-
-    def test_video_sources_response_model(
-        self, mock_video_sources_response: list[dict]
-    ) -> None:
-        """Test that VideoSourcesList model validates a get video sources response."""
-        validated_sources = VideoSourcesList.model_validate(mock_video_sources_response)
-
-        assert isinstance(validated_sources, VideoSourcesList)
-        assert len(validated_sources.root) == len(mock_video_sources_response)
-        assert validated_sources.root[0].src == mock_video_sources_response[0]["src"]
-
-    def test_video_variants_response_model(
-        self, mock_video_variants_response: list[dict]
-    ) -> None:
-        """Test that VideoVariants model validates a get video variants response."""
-        validated_variants = VideoVariants.model_validate(mock_video_variants_response)
-
-        assert isinstance(validated_variants, VideoVariants)
-        assert len(validated_variants.root) == len(mock_video_variants_response)
-        assert (
-            validated_variants.root[0].language
-            == mock_video_variants_response[0]["language"]
-        )
-        assert (
-            validated_variants.root[1].language
-            == mock_video_variants_response[1]["language"]
-        )
-
-    def test_get_video_images_response_model(
-        self, mock_video_images_response: dict[str, dict]
-    ) -> None:
-        """Test that ImageList model validates a get video images response."""
-        validated_response = ImageList.model_validate(mock_video_images_response)
-
-        assert isinstance(validated_response, ImageList)
-        assert validated_response is not None
-        assert validated_response.root["thumbnail"] is not None
-        assert (
-            validated_response.root["thumbnail"].src
-            == mock_video_images_response["thumbnail"]["src"]
-        )
-
-    def test_create_video_variant_response_model(
-        self,
-        mock_create_video_variant_response: dict,
-    ) -> None:
-        """Test that VideoVariant model validates a create video variant response."""
-        validated_variant: VideoVariant = VideoVariant.model_validate(
-            mock_create_video_variant_response
-        )
-
-        assert isinstance(validated_variant, VideoVariant)
-        assert (
-            validated_variant.language == mock_create_video_variant_response["language"]
-        )
-        assert validated_variant.name == mock_create_video_variant_response["name"]
-        assert (
-            validated_variant.description
-            == mock_create_video_variant_response["description"]
-        )
-        assert (
-            validated_variant.long_description
-            == mock_create_video_variant_response["long_description"]
-        )
-        assert (
-            validated_variant.custom_fields
-            == mock_create_video_variant_response["custom_fields"]
-        )
-
-    def test_get_video_audio_tracks_response_model(
-        self,
-        mock_get_audio_tracks_response: list[dict],
-    ) -> None:
-        """Test that AudioTracks model validates a get video audio tracks response."""
-
-        validated_response: AudioTracks = AudioTracks.model_validate(
-            mock_get_audio_tracks_response
-        )
-
-        assert isinstance(validated_response, AudioTracks)
-        assert len(validated_response.root) == len(mock_get_audio_tracks_response)
-        assert (
-            validated_response.root[0].language
-            == mock_get_audio_tracks_response[0]["language"]
-        )
-
-    def test_get_digital_master_response_model(
-        self,
-        mock_get_digital_master_response: dict,
-    ) -> None:
-        """Test that DigitalMaster model validates a get digital master response."""
-
-        validated_response: CMSDigitalMaster = CMSDigitalMaster.model_validate(
-            mock_get_digital_master_response
-        )
-
-        assert isinstance(validated_response, CMSDigitalMaster)
-        assert (
-            validated_response.created_at
-            == mock_get_digital_master_response["created_at"]
-        )
-        assert (
-            validated_response.updated_at
-            == mock_get_digital_master_response["updated_at"]
-        )
-        assert (
-            validated_response.encoding_rate
-            == mock_get_digital_master_response["encoding_rate"]
-        )
-
-    def test_get_playlists_for_video_response_model(
-        self,
-        mock_get_playlists_response: list[int],
-    ) -> None:
-        """Test that Playlist model validates a get playlists response."""
-
-        validated_response: PlaylistReferences = PlaylistReferences(
-            playlists=mock_get_playlists_response  # ty:ignore[invalid-argument-type]
-        )
-
-        assert isinstance(validated_response, PlaylistReferences)
-        assert isinstance(validated_response.playlists, Sized)
-        assert len(validated_response.playlists) == len(mock_get_playlists_response)
-        assert validated_response.playlists[0] == str(
-            mock_get_playlists_response[0]
-        )  # API returns playlist IDs as ints, model should coerce to str
+def _check_playlists(validated: PlaylistReferences) -> None:
+    assert isinstance(validated.playlists, Sized)
+    assert len(validated.playlists) == len(MOCK_PLAYLISTS)
+    # API returns playlist IDs as ints, model should coerce to str
+    assert validated.playlists[0] == str(MOCK_PLAYLISTS[0])
+
+
+RESPONSE_CASES = [
+    pytest.param(
+        VideoArray,
+        _VIDEO_ARRAY_TA,
+        MOCK_VIDEO_BYTES,
+        _check_video_array,
+        id="video_array",
+    ),
+    pytest.param(
+        Video,
+        _VIDEO_TA,
+        MOCK_CREATE_VIDEO_BYTES,
+        _check_create_video,
+        id="create_video",
+    ),
+    pytest.param(
+        VideoCount,
+        _VIDEO_COUNT_TA,
+        MOCK_VIDEO_COUNT_BYTES,
+        _check_video_count,
+        id="video_count",
+    ),
+    pytest.param(
+        VideoSourcesList,
+        _VIDEO_SRC_TA,
+        MOCK_VIDEO_SOURCES_BYTES,
+        _check_video_sources,
+        id="video_sources",
+    ),
+    pytest.param(
+        VideoVariants,
+        _VIDEO_VARIANTS_TA,
+        MOCK_VIDEO_VARIANTS_BYTES,
+        _check_video_variants,
+        id="video_variants",
+    ),
+    pytest.param(
+        ImageList,
+        _IMAGE_LIST_TA,
+        MOCK_VIDEO_IMAGES_BYTES,
+        _check_video_images,
+        id="video_images",
+    ),
+    pytest.param(
+        VideoVariant,
+        _VARIANT_TA,
+        MOCK_CREATE_VIDEO_VARIANT_BYTES,
+        _check_create_video_variant,
+        id="create_video_variant",
+    ),
+    pytest.param(
+        AudioTracks,
+        _AUDIO_TA,
+        MOCK_AUDIO_TRACKS_BYTES,
+        _check_audio_tracks,
+        id="audio_tracks",
+    ),
+    pytest.param(
+        CMSDigitalMaster,
+        _DIGITAL_MASTER_TA,
+        MOCK_DIGITAL_MASTER_BYTES,
+        _check_digital_master,
+        id="digital_master",
+    ),
+    pytest.param(
+        PlaylistReferences,
+        _PLAYLIST_REFS_TA,
+        b'{"playlists": ' + MOCK_PLAYLISTS_BYTES + b"}",
+        _check_playlists,
+        id="playlists",
+    ),
+]
+
+
+@pytest.mark.skipif(not _HAVE_MOCKS, reason="mock_responses/ not present")
+@pytest.mark.parametrize(("model", "adapter", "payload", "check"), RESPONSE_CASES)
+def test_response_validates(model, adapter, payload, check):
+    """Test that each response model validates a real API response."""
+    validated = adapter.validate_json(payload)
+    assert isinstance(validated, model)
+    check(validated)
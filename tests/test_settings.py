@@ -0,0 +1,53 @@
+"""Tests for the pydantic-settings configuration models."""
+
+import pytest
+
+from brightcove_async.settings import BrightcoveBaseAPIConfig, BrightcoveOAuthCreds
+
+
+@pytest.fixture(scope="module")
+def default_config():
+    """Default API configuration, built once for the module."""
+    return BrightcoveBaseAPIConfig()
+
+
+@pytest.mark.parametrize(
+    ("attr", "expected"),
+    [
+        ("cms_base_url", "https://cms.api.brightcove.com/v1/accounts/"),
+        ("syndication_base_url", "https://social.api.brightcove.com/v1"),
+        ("analytics_base_url", "https://analytics.api.brightcove.com/v1"),
+        ("dynamic_ingest_base_url", "https://ingest.api.brightcove.com/v1/accounts/"),
+        ("ingest_profiles_base_url", "https://ingestion.api.brightcove.com/v1/"),
+        ("audience_base_url", "https://audience.api.brightcove.com/v1"),
+    ],
+)
+def test_default_url(default_config, attr, expected):
+    assert getattr(default_config, attr) == expected
+
+
+def test_custom_urls():
+    config = BrightcoveBaseAPIConfig(
+        cms_base_url="https://custom-cms.example.com/",
+        syndication_base_url="https://custom-syndication.example.com/",
+    )
+
+    assert config.cms_base_url == "https://custom-cms.example.com/"
+    assert config.syndication_base_url == "https://custom-syndication.example.com/"
+
+
+def test_partial_override(default_config):
+    config = BrightcoveBaseAPIConfig(analytics_base_url="https://a.example.com/")
+
+    assert config.analytics_base_url == "https://a.example.com/"
+    assert config.cms_base_url == default_config.cms_base_url
+
+
+def test_oauth_creds_from_env(monkeypatch):
+    monkeypatch.setenv("CLIENT_ID", "env_id")
+    monkeypatch.setenv("CLIENT_SECRET", "env_secret")
+
+    creds = BrightcoveOAuthCreds()
+
+    assert creds.client_id == "env_id"
+    assert creds.client_secret.get_secret_value() == "env_secret"
@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import aiohttp
 import pytest
@@ -13,25 +13,12 @@ from brightcove_async.schemas.syndication_model import (
 from brightcove_async.services.syndication import Syndication
 
 BASE_URL = "https://social.api.brightcove.com/v1"
+LIST_ENDPOINT = f"{BASE_URL}/accounts/account123/mrss/syndications"
+ITEM_ENDPOINT = f"{LIST_ENDPOINT}/syn456"
+TEMPLATE_ENDPOINT = f"{ITEM_ENDPOINT}/template"
 
-
-class DummyOAuth:
-    async def get_access_token(self):
-        return "test_token"
-
-    @property
-    async def headers(self):
-        return {"Authorization": "Bearer test_token"}
-
-
-@pytest.fixture
-def mock_session():
-    return AsyncMock(spec=aiohttp.ClientSession)
-
-
-@pytest.fixture
-def dummy_oauth():
-    return DummyOAuth()
+_EMPTY_LIST = SyndicationList.model_construct(root=[])
+_ONE_SYNDICATION = SyndicationModel.model_construct(name="Test", type=Type.google)
 
 
 @pytest.fixture
@@ -44,106 +31,75 @@ def syndication_service(mock_session, dummy_oauth):
     )
 
 
+@pytest.fixture
+def mock_fetch(syndication_service, monkeypatch):
+    """Replace the service's fetch_data with an AsyncMock."""
+    mock = AsyncMock()
+    monkeypatch.setattr(syndication_service, "fetch_data", mock)
+    return mock
+
+
 def test_syndication_initialization(syndication_service):
     assert syndication_service._limit == 10
     assert syndication_service.base_url == BASE_URL
 
 
-@pytest.mark.asyncio
-async def test_get_all_syndications(syndication_service):
-    with patch.object(
-        syndication_service, "fetch_data", new_callable=AsyncMock
-    ) as mock_fetch:
-        mock_fetch.return_value = SyndicationList(root=[])
-
-        await syndication_service.get_all_syndications("account123")
-
-        mock_fetch.assert_called_once()
-        call_args = mock_fetch.call_args
-        assert "account123" in call_args.kwargs["endpoint"]
-        assert "mrss/syndications" in call_args.kwargs["endpoint"]
-        assert call_args.kwargs["model"] == SyndicationList
-
-
-@pytest.mark.asyncio
-async def test_get_syndication(syndication_service):
-    with patch.object(
-        syndication_service, "fetch_data", new_callable=AsyncMock
-    ) as mock_fetch:
-        mock_fetch.return_value = SyndicationModel(name="Test", type=Type.google)
-
-        await syndication_service.get_syndication("account123", "syndication456")
-
-        mock_fetch.assert_called_once()
-        call_args = mock_fetch.call_args
-        assert "account123" in call_args.kwargs["endpoint"]
-        assert "syndication456" in call_args.kwargs["endpoint"]
-        assert call_args.kwargs["model"] == SyndicationModel
-
-
-@pytest.mark.asyncio
-async def test_create_syndication(syndication_service):
-    syndication = SyndicationModel(name="Test Feed", type=Type.google)
-
-    with patch.object(
-        syndication_service, "fetch_data", new_callable=AsyncMock
-    ) as mock_fetch:
-        mock_fetch.return_value = MagicMock(spec=SyndicationModel)
-
-        await syndication_service.create_syndication("account123", syndication)
-
-        mock_fetch.assert_called_once()
-        call_args = mock_fetch.call_args
-        assert "account123" in call_args.kwargs["endpoint"]
-        assert "mrss/syndications" in call_args.kwargs["endpoint"]
-        assert call_args.kwargs["method"] == "POST"
-        assert call_args.kwargs["model"] == SyndicationModel
-        assert call_args.kwargs["payload"] == syndication
-
-
-@pytest.mark.asyncio
-async def test_update_syndication(syndication_service):
-    syndication = SyndicationModel(name="Updated Feed", type=Type.itunes)
-
-    with patch.object(
-        syndication_service, "fetch_data", new_callable=AsyncMock
-    ) as mock_fetch:
-        mock_fetch.return_value = MagicMock(spec=SyndicationModel)
-
-        await syndication_service.update_syndication(
-            "account123", "syn456", syndication
-        )
-
-        mock_fetch.assert_called_once()
-        call_args = mock_fetch.call_args
-        assert "account123" in call_args.kwargs["endpoint"]
-        assert "syn456" in call_args.kwargs["endpoint"]
-        assert call_args.kwargs["method"] == "PUT"
-        assert call_args.kwargs["model"] == SyndicationModel
-        assert call_args.kwargs["payload"] == syndication
-
-
-@pytest.mark.asyncio
-async def test_patch_syndication(syndication_service):
-    syndication = SyndicationModel(name="Patched Feed", type=Type.roku)
-
-    with patch.object(
-        syndication_service, "fetch_data", new_callable=AsyncMock
-    ) as mock_fetch:
-        mock_fetch.return_value = MagicMock(spec=SyndicationModel)
+@pytest.mark.parametrize(
+    ("method", "args", "expected"),
+    [
+        (
+            "get_all_syndications",
+            ("account123",),
+            {"endpoint": LIST_ENDPOINT, "model": SyndicationList},
+        ),
+        (
+            "get_syndication",
+            ("account123", "syn456"),
+            {"endpoint": ITEM_ENDPOINT, "model": SyndicationModel},
+        ),
+        (
+            "create_syndication",
+            ("account123", _ONE_SYNDICATION),
+            {
+                "endpoint": LIST_ENDPOINT,
+                "model": SyndicationModel,
+                "method": "POST",
+                "payload": _ONE_SYNDICATION,
+            },
+        ),
+        (
+            "update_syndication",
+            ("account123", "syn456", _ONE_SYNDICATION),
+            {
+                "endpoint": ITEM_ENDPOINT,
+                "model": SyndicationModel,
+                "method": "PUT",
+                "payload": _ONE_SYNDICATION,
+            },
+        ),
+        (
+            "patch_syndication",
+            ("account123", "syn456", _ONE_SYNDICATION),
+            {
+                "endpoint": ITEM_ENDPOINT,
+                "model": SyndicationModel,
+                "method": "PATCH",
+                "payload": _ONE_SYNDICATION,
+            },
+        ),
+    ],
+)
+async def test_fetch_data_call(syndication_service, mock_fetch, method, args, expected):
+    mock_fetch.return_value = (
+        _EMPTY_LIST if expected["model"] is SyndicationList else _ONE_SYNDICATION
+    )
 
-        await syndication_service.patch_syndication("account123", "syn456", syndication)
+    result = await getattr(syndication_service, method)(*args)
 
-        mock_fetch.assert_called_once()
-        call_args = mock_fetch.call_args
-        assert "account123" in call_args.kwargs["endpoint"]
-        assert "syn456" in call_args.kwargs["endpoint"]
-        assert call_args.kwargs["method"] == "PATCH"
-        assert call_args.kwargs["model"] == SyndicationModel
-        assert call_args.kwargs["payload"] == syndication
+    mock_fetch.assert_called_once_with(**expected)
+    assert result is mock_fetch.return_value
 
 
-@pytest.mark.asyncio
 async def test_delete_syndication(syndication_service, mock_session):
     mock_response = AsyncMock()
     mock_response.raise_for_status = MagicMock()
@@ -153,13 +109,9 @@ async def test_delete_syndication(syndication_service, mock_session):
 
     mock_session.request.assert_called_once()
     call_args = mock_session.request.call_args
-    assert call_args.args[0] == "DELETE"
-    assert "account123" in call_args.args[1]
-    assert "syn456" in call_args.args[1]
-    assert "mrss/syndications" in call_args.args[1]
+    assert call_args.args[:2] == ("DELETE", ITEM_ENDPOINT)
 
 
-@pytest.mark.asyncio
 async def test_get_template(syndication_service, mock_session):
     mock_response = AsyncMock()
     mock_response.raise_for_status = MagicMock()
@@ -170,14 +122,10 @@ async def test_get_template(syndication_service, mock_session):
 
     mock_session.request.assert_called_once()
     call_args = mock_session.request.call_args
-    assert call_args.args[0] == "GET"
-    assert "account123" in call_args.args[1]
-    assert "syn456" in call_args.args[1]
-    assert "template" in call_args.args[1]
+    assert call_args.args[:2] == ("GET", TEMPLATE_ENDPOINT)
     assert result == "<feed>template content</feed>"
 
 
-@pytest.mark.asyncio
 async def test_upload_template(syndication_service, mock_session):
     template_content = "<feed>my custom template</feed>"
     mock_response = AsyncMock()
@@ -188,33 +136,21 @@ async def test_upload_template(syndication_service, mock_session):
 
     mock_session.request.assert_called_once()
     call_args = mock_session.request.call_args
-    assert call_args.args[0] == "PUT"
-    assert "account123" in call_args.args[1]
-    assert "syn456" in call_args.args[1]
-    assert "template" in call_args.args[1]
+    assert call_args.args[:2] == ("PUT", TEMPLATE_ENDPOINT)
     assert call_args.kwargs.get("data") == template_content
     assert call_args.kwargs.get("headers", {}).get("Content-Type") == "text/plain"
 
 
-@pytest.mark.asyncio
-async def test_delete_syndication_retries_on_connection_error(
-    syndication_service, mock_session
-):
-    mock_response = AsyncMock()
-    mock_response.raise_for_status = MagicMock()
-    mock_session.request.return_value.__aenter__.side_effect = [
-        aiohttp.ClientConnectionError("Connection failed"),
-        mock_response,
-    ]
-
-    await syndication_service.delete_syndication("account123", "syn456")
-
-    assert mock_session.request.call_count == 2
-
-
-@pytest.mark.asyncio
-async def test_get_template_retries_on_connection_error(
-    syndication_service, mock_session
+@pytest.mark.parametrize(
+    ("method", "args", "expected"),
+    [
+        ("delete_syndication", ("account123", "syn456"), None),
+        ("get_template", ("account123", "syn456"), "<feed/>"),
+        ("upload_template", ("account123", "syn456", "<feed/>"), None),
+    ],
+)
+async def test_retries_on_connection_error(
+    syndication_service, mock_session, method, args, expected
 ):
     mock_response = AsyncMock()
     mock_response.raise_for_status = MagicMock()
@@ -224,23 +160,7 @@ async def test_get_template_retries_on_connection_error(
         mock_response,
     ]
 
-    result = await syndication_service.get_template("account123", "syn456")
-
-    assert result == "<feed/>"
-    assert mock_session.request.call_count == 2
-
-
-@pytest.mark.asyncio
-async def test_upload_template_retries_on_connection_error(
-    syndication_service, mock_session
-):
-    mock_response = AsyncMock()
-    mock_response.raise_for_status = MagicMock()
-    mock_session.request.return_value.__aenter__.side_effect = [
-        aiohttp.ClientConnectionError("Connection failed"),
-        mock_response,
-    ]
-
-    await syndication_service.upload_template("account123", "syn456", "<feed/>")
+    result = await getattr(syndication_service, method)(*args)
 
+    assert result == expected
     assert mock_session.request.call_count == 2